@@ -13,6 +13,7 @@ from workspace_sdk import (
     AsyncWorkspaceClient,
     CreateSandboxParams,
     RunCommandOptions,
+    taskgroup_gather,
 )
 
 
@@ -41,8 +42,7 @@ async def main():
                 return idx, result.stdout.strip()
 
             # Run 5 tasks concurrently
-            tasks = [run_command(i) for i in range(5)]
-            results = await asyncio.gather(*tasks)
+            results = await taskgroup_gather(run_command(i) for i in range(5))
 
             for idx, output in results:
                 print(f"   Task {idx}: {output}")
@@ -14,6 +14,7 @@ from workspace_sdk import (
     AsyncWorkspaceClient,
     CreateSandboxParams,
     RunCommandOptions,
+    taskgroup_gather,
 )
 
 
@@ -34,9 +35,10 @@ async def main():
             print(f"   Sandbox {idx} created: {sandbox.id}")
             return sandbox
 
-        sandboxes = await asyncio.gather(*[
+        # A failed create cancels the others instead of leaving them running
+        sandboxes = await taskgroup_gather(
             create_sandbox(i) for i in range(num_sandboxes)
-        ])
+        )
 
         elapsed = time.time() - start
         print(f"   All sandboxes created in {elapsed:.2f}s\n")
@@ -54,9 +56,9 @@ async def main():
                 )
                 return idx, result
 
-            results = await asyncio.gather(*[
+            results = await taskgroup_gather(
                 run_in_sandbox(i, s) for i, s in enumerate(sandboxes)
-            ])
+            )
 
             elapsed = time.time() - start
             print(f"   All commands completed in {elapsed:.2f}s\n")
@@ -79,9 +81,10 @@ async def main():
                 )
                 return cmd_idx, result.stdout.strip()
 
-            cmd_results = await asyncio.gather(*[
-                run_command(sandboxes[0].id, i) for i in range(10)
-            ])
+            cmd_results = await taskgroup_gather(
+                (run_command(sandboxes[0].id, i) for i in range(10)),
+                max_concurrency=5,
+            )
 
             elapsed = time.time() - start
             print(f"   10 commands completed in {elapsed:.2f}s (concurrent)\n")
@@ -98,9 +101,12 @@ async def main():
                 await client.sandbox.delete(sandbox.id, force=True)
                 print(f"   Deleted sandbox {idx}")
 
-            await asyncio.gather(*[
-                delete_sandbox(i, s) for i, s in enumerate(sandboxes)
-            ])
+            # Cleanup should not stop at the first failure, so collect
+            # exceptions instead of cancelling the remaining deletes
+            await asyncio.gather(
+                *[delete_sandbox(i, s) for i, s in enumerate(sandboxes)],
+                return_exceptions=True,
+            )
 
             elapsed = time.time() - start
             print(f"   All sandboxes deleted in {elapsed:.2f}s")
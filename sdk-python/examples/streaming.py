@@ -31,7 +31,8 @@ def main():
             print("2. Streaming loop output (sync)...")
             print("   Output: ", end="", flush=True)
 
-            for event in client.process.run_stream(
+            # The context manager closes the stream even when we break early
+            with client.process.run_stream(
                 sandbox.id,
                 "bash",
                 RunCommandOptions(args=["-c", """
@@ -40,18 +41,19 @@ def main():
                         sleep 0.5
                     done
                 """])
-            ):
-                if event.type == "stdout":
-                    # Print each line as it arrives
-                    print(event.data, end="", flush=True)
-                elif event.type == "stderr":
-                    print(event.data, end="", file=sys.stderr, flush=True)
-                elif event.type == "exit":
-                    print(f"\n   Exited with code: {event.code}\n")
-                    break
-                elif event.type == "error":
-                    print(f"\n   Error: {event.message}\n")
-                    break
+            ) as events:
+                for event in events:
+                    if event.type == "stdout":
+                        # Print each line as it arrives
+                        print(event.data, end="", flush=True)
+                    elif event.type == "stderr":
+                        print(event.data, end="", file=sys.stderr, flush=True)
+                    elif event.type == "exit":
+                        print(f"\n   Exited with code: {event.code}\n")
+                        break
+                    elif event.type == "error":
+                        print(f"\n   Error: {event.message}\n")
+                        break
 
             # 3. Stream with interleaved stdout/stderr
             print("3. Streaming with stdout and stderr...")
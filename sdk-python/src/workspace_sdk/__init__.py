@@ -7,6 +7,13 @@ Supports both synchronous and asynchronous APIs.
 
 from workspace_sdk.client import WorkspaceClient
 from workspace_sdk.async_client import AsyncWorkspaceClient
+from workspace_sdk.eventloop import install_uvloop, taskgroup_gather
+from workspace_sdk.transport import (
+    api_base_url,
+    build_async_client,
+    build_client,
+    create_shared_transport,
+)
 from workspace_sdk.types import (
     Sandbox,
     SandboxState,
@@ -14,6 +21,7 @@ from workspace_sdk.types import (
     CommandResult,
     RunCommandOptions,
     ProcessEvent,
+    dispatch,
     PtyOptions,
     PtyHandle,
     FileInfo,
@@ -28,6 +36,7 @@ from workspace_sdk.errors import (
     ProcessTimeoutError,
     PtyNotFoundError,
     AgentNotConnectedError,
+    ClientNotOpenError,
 )
 
 __version__ = "0.1.0"
@@ -36,6 +45,14 @@ __all__ = [
     # Clients
     "WorkspaceClient",
     "AsyncWorkspaceClient",
+    # Event loop
+    "install_uvloop",
+    "taskgroup_gather",
+    # Transport
+    "create_shared_transport",
+    "build_client",
+    "build_async_client",
+    "api_base_url",
     # Types
     "Sandbox",
     "SandboxState",
@@ -43,6 +60,7 @@ __all__ = [
     "CommandResult",
     "RunCommandOptions",
     "ProcessEvent",
+    "dispatch",
     "PtyOptions",
     "PtyHandle",
     "FileInfo",
@@ -56,4 +74,5 @@ __all__ = [
     "ProcessTimeoutError",
     "PtyNotFoundError",
     "AgentNotConnectedError",
+    "ClientNotOpenError",
 ]
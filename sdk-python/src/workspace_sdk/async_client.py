@@ -2,24 +2,74 @@
 Async Workspace Client - Main entry point for async SDK usage
 """
 
-from typing import Optional
+from typing import Any, Awaitable, List, Optional
+import asyncio
+import ssl
 import httpx
 
 from workspace_sdk.services.workspace import AsyncWorkspaceService
 from workspace_sdk.services.sandbox import AsyncSandboxService
 from workspace_sdk.services.process import AsyncProcessService
 from workspace_sdk.services.pty import AsyncPtyService
-from workspace_sdk.errors import parse_error_response
+from workspace_sdk.auth import BearerAuth
+from workspace_sdk.errors import ClientNotOpenError, parse_error_response
+from workspace_sdk.serialization import AsyncJsonClient, loads
+from workspace_sdk.transport import (
+    ACCEPT_HEADERS,
+    DEFAULT_MAX_CONNECTIONS,
+    DEFAULT_MAX_KEEPALIVE,
+    PREWARM_TIMEOUT,
+    BoundedAsyncTransport,
+    api_base_url,
+    build_async_transport,
+)
+from workspace_sdk.eventloop import install_uvloop
 
 
 class AsyncWorkspaceClient:
-    """Async client for interacting with the Workspace service"""
+    """Async client for interacting with the Workspace service
+
+    Instances use ``__slots__``, so attributes cannot be added to them.
+    """
+
+    __slots__ = (
+        "_api_url",
+        "_base_url",
+        "_api_key",
+        "_auth",
+        "_timeout",
+        "_use_uvloop",
+        "_max_connections",
+        "_max_keepalive",
+        "_max_concurrency",
+        "_transport",
+        "_max_batch_size",
+        "_batch_window_ms",
+        "_prewarm",
+        "_ssl_context",
+        "_prewarm_task",
+        "_client",
+        "_sem",
+        "_workspace",
+        "_sandbox",
+        "_process",
+        "_pty",
+    )
 
     def __init__(
         self,
         api_url: str,
         api_key: Optional[str] = None,
         timeout: float = 30.0,
+        use_uvloop: bool = False,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive: int = DEFAULT_MAX_KEEPALIVE,
+        max_concurrency: int = 100,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        max_batch_size: int = 32,
+        batch_window_ms: float = 5,
+        prewarm: bool = True,
+        ssl_context: Optional[ssl.SSLContext] = None,
     ):
         """
         Initialize the async workspace client.
@@ -28,57 +78,188 @@ class AsyncWorkspaceClient:
             api_url: Base URL of the workspace server
             api_key: Optional API key for authentication
             timeout: Request timeout in seconds (default: 30)
+            use_uvloop: Install the uvloop event loop policy on enter if uvloop
+                is available (default: False). The policy is process-wide and
+                only applies to loops created afterwards, never to the loop
+                already running; call ``install_uvloop()`` before
+                ``asyncio.run()`` to run the current program on uvloop.
+            max_connections: Maximum number of pooled connections (default: 200)
+            max_keepalive: Maximum number of idle keep-alive connections (default: 100)
+            max_concurrency: Maximum number of requests in flight at once (default: 100)
+            transport: Shared transport to reuse instead of creating a connection
+                pool per client (see ``create_shared_transport()``). It is not
+                closed when the client exits.
+            max_batch_size: Maximum concurrent sandbox creates/deletes sent as one
+                batch request, at most 32; 1 disables batching (default: 32)
+            batch_window_ms: How long sandbox creates/deletes issued while another
+                one is in flight wait to be batched together, in milliseconds
+                (default: 5); a call with nothing in flight is sent at once
+            prewarm: Open a pooled connection in the background on enter by
+                requesting ``/health``, so the first real call does not pay
+                for TCP/TLS setup (default: True)
+            ssl_context: SSL context for HTTPS connections, e.g. one loaded with
+                a client certificate for mutual TLS (default: a shared context
+                with httpx's default CA bundle). Ignored when ``transport`` is given.
         """
         self._api_url = api_url
+        self._base_url = api_base_url(api_url)
         self._api_key = api_key
+        self._auth = BearerAuth(api_key) if api_key else None
         self._timeout = timeout
+        self._use_uvloop = use_uvloop
+        self._max_connections = max_connections
+        self._max_keepalive = max_keepalive
+        self._max_concurrency = max_concurrency
+        self._transport = transport
+        self._max_batch_size = max_batch_size
+        self._batch_window_ms = batch_window_ms
+        self._prewarm = prewarm
+        self._ssl_context = ssl_context
+        self._prewarm_task: Optional[asyncio.Task] = None
         self._client: Optional[httpx.AsyncClient] = None
+        self._sem: Optional[asyncio.Semaphore] = None
 
         # Services will be initialized when context manager is entered
-        self.workspace: AsyncWorkspaceService
-        self.sandbox: AsyncSandboxService
-        self.process: AsyncProcessService
-        self.pty: AsyncPtyService
+        self._workspace: Optional[AsyncWorkspaceService] = None
+        self._sandbox: Optional[AsyncSandboxService] = None
+        self._process: Optional[AsyncProcessService] = None
+        self._pty: Optional[AsyncPtyService] = None
 
     async def __aenter__(self) -> "AsyncWorkspaceClient":
         """Enter async context manager"""
-        headers = {"Content-Type": "application/json"}
-        if self._api_key:
-            headers["Authorization"] = f"Bearer {self._api_key}"
+        if self._use_uvloop:
+            install_uvloop()
+        self._sem = asyncio.Semaphore(self._max_concurrency)
 
-        self._client = httpx.AsyncClient(
-            base_url=f"{self._api_url}/api/v1",
-            headers=headers,
+        self._client = AsyncJsonClient(
+            base_url=self._base_url,
+            headers=ACCEPT_HEADERS,
+            auth=self._auth,
             timeout=self._timeout,
+            transport=BoundedAsyncTransport(
+                self._transport
+                or build_async_transport(
+                    self._max_connections,
+                    self._max_keepalive,
+                    ssl_context=self._ssl_context,
+                ),
+                self._sem,
+                close_transport=self._transport is None,
+            ),
         )
 
         # Initialize services
-        self.workspace = AsyncWorkspaceService(self._client, self._api_url)
-        self.sandbox = AsyncSandboxService(self._client, self._api_url)
-        self.process = AsyncProcessService(self._client, self._api_url)
-        self.pty = AsyncPtyService(self._client, self._api_url)
+        self._workspace = AsyncWorkspaceService(self._client, self._base_url)
+        self._sandbox = AsyncSandboxService(
+            self._client,
+            self._base_url,
+            max_batch_size=self._max_batch_size,
+            batch_window_ms=self._batch_window_ms,
+        )
+        self._process = AsyncProcessService(self._client, self._base_url)
+        self._pty = AsyncPtyService(self._client, self._base_url)
+
+        if self._prewarm:
+            self._prewarm_task = asyncio.create_task(self._warm_up())
 
         return self
 
+    async def _warm_up(self) -> None:
+        """Establish a pooled connection ahead of the first request"""
+        try:
+            await self._client.get("/health", timeout=PREWARM_TIMEOUT)
+        except httpx.HTTPError:
+            # Best effort: the first real request will surface any problem
+            pass
+
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
         """Exit async context manager"""
+        if self._prewarm_task:
+            self._prewarm_task.cancel()
+            self._prewarm_task = None
         if self._client:
             await self._client.aclose()
             self._client = None
+        self._sem = None
+        self._workspace = self._sandbox = self._process = self._pty = None
+
+    @property
+    def workspace(self) -> AsyncWorkspaceService:
+        """Workspace and file operations"""
+        if self._workspace is None:
+            raise ClientNotOpenError("async with")
+        return self._workspace
+
+    @property
+    def sandbox(self) -> AsyncSandboxService:
+        """Sandbox lifecycle operations"""
+        if self._sandbox is None:
+            raise ClientNotOpenError("async with")
+        return self._sandbox
+
+    @property
+    def process(self) -> AsyncProcessService:
+        """Command execution"""
+        if self._process is None:
+            raise ClientNotOpenError("async with")
+        return self._process
+
+    @property
+    def pty(self) -> AsyncPtyService:
+        """Terminal sessions"""
+        if self._pty is None:
+            raise ClientNotOpenError("async with")
+        return self._pty
 
     async def health(self) -> dict:
         """Check if the server is healthy"""
         if not self._client:
-            raise RuntimeError("Client not initialized. Use 'async with' context manager.")
+            raise ClientNotOpenError("async with")
         response = await self._client.get("/health")
         response.raise_for_status()
-        return response.json()
+        return loads(response.content)
+
+    async def bounded_gather(
+        self,
+        *aws: Awaitable[Any],
+        return_exceptions: bool = False,
+    ) -> List[Any]:
+        """
+        Like ``asyncio.gather``, but runs at most ``max_concurrency`` awaitables at once.
+
+        The limit is tracked separately from the per-request limit, so a gated
+        coroutine can issue several requests without starving the pool.
+
+        Usage:
+            sandboxes = await client.bounded_gather(
+                *[client.sandbox.create(params) for _ in range(1000)]
+            )
+        """
+        limiter = asyncio.Semaphore(self._max_concurrency)
+
+        async def run(aw: Awaitable[Any]) -> Any:
+            async with limiter:
+                return await aw
+
+        return await asyncio.gather(
+            *[run(aw) for aw in aws],
+            return_exceptions=return_exceptions,
+        )
 
     @staticmethod
     def create(
         api_url: str,
         api_key: Optional[str] = None,
         timeout: float = 30.0,
+        use_uvloop: bool = False,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive: int = DEFAULT_MAX_KEEPALIVE,
+        max_concurrency: int = 100,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        max_batch_size: int = 32,
+        batch_window_ms: float = 5,
+        prewarm: bool = True,
+        ssl_context: Optional[ssl.SSLContext] = None,
     ) -> "AsyncWorkspaceClient":
         """
         Factory method to create an AsyncWorkspaceClient.
@@ -88,4 +269,17 @@ class AsyncWorkspaceClient:
                 workspace = await client.workspace.create()
                 sandbox = await client.sandbox.create(CreateSandboxParams(workspace_id=workspace.id))
         """
-        return AsyncWorkspaceClient(api_url, api_key, timeout)
+        return AsyncWorkspaceClient(
+            api_url,
+            api_key,
+            timeout,
+            use_uvloop=use_uvloop,
+            max_connections=max_connections,
+            max_keepalive=max_keepalive,
+            max_concurrency=max_concurrency,
+            transport=transport,
+            max_batch_size=max_batch_size,
+            batch_window_ms=batch_window_ms,
+            prewarm=prewarm,
+            ssl_context=ssl_context,
+        )
@@ -0,0 +1,18 @@
+"""
+Authentication for SDK requests
+"""
+
+from typing import Generator
+
+import httpx
+
+
+class BearerAuth(httpx.Auth):
+    """Attach a bearer token to every request"""
+
+    def __init__(self, token: str):
+        self._authorization = f"Bearer {token}"
+
+    def auth_flow(self, request: httpx.Request) -> Generator[httpx.Request, httpx.Response, None]:
+        request.headers["Authorization"] = self._authorization
+        yield request
@@ -0,0 +1,37 @@
+"""
+Small time-based cache for resource lookups
+"""
+
+import time
+from typing import Any, Dict, Optional, Tuple
+
+
+class TTLCache:
+    """Bounded mapping whose entries are only returned while younger than a caller-given TTL"""
+
+    def __init__(self, maxsize: int = 1024):
+        self._maxsize = maxsize
+        self._entries: Dict[str, Tuple[Any, float]] = {}
+
+    def get(self, key: str, ttl: float) -> Optional[Any]:
+        """Return the cached value if it was stored less than ``ttl`` seconds ago"""
+        if ttl <= 0:
+            return None
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        value, stored_at = entry
+        if time.monotonic() - stored_at >= ttl:
+            return None
+        return value
+
+    def put(self, key: str, value: Any) -> None:
+        """Store a value, evicting the oldest entry when full"""
+        self._entries.pop(key, None)
+        if len(self._entries) >= self._maxsize:
+            del self._entries[next(iter(self._entries))]
+        self._entries[key] = (value, time.monotonic())
+
+    def invalidate(self, key: str) -> None:
+        """Drop a cached value"""
+        self._entries.pop(key, None)
@@ -3,6 +3,7 @@ Sync Workspace Client - Main entry point for synchronous SDK usage
 """
 
 from typing import Optional
+import ssl
 import httpx
 
 from workspace_sdk.services.workspace import WorkspaceService
@@ -10,11 +11,44 @@ from workspace_sdk.services.sandbox import SandboxService
 from workspace_sdk.services.process import ProcessService
 from workspace_sdk.services.pty import PtyService
 from workspace_sdk.services.nfs import NfsService
-from workspace_sdk.errors import parse_error_response
+from workspace_sdk.auth import BearerAuth
+from workspace_sdk.errors import ClientNotOpenError, parse_error_response
+from workspace_sdk.serialization import JsonClient, loads
+from workspace_sdk.transport import (
+    ACCEPT_HEADERS,
+    DEFAULT_MAX_CONNECTIONS,
+    DEFAULT_MAX_KEEPALIVE,
+    PREWARM_TIMEOUT,
+    api_base_url,
+    build_transport,
+)
 
 
 class WorkspaceClient:
-    """Synchronous client for interacting with the Workspace service"""
+    """Synchronous client for interacting with the Workspace service
+
+    Instances use ``__slots__``, so attributes cannot be added to them.
+    """
+
+    __slots__ = (
+        "_api_url",
+        "_base_url",
+        "_api_key",
+        "_auth",
+        "_timeout",
+        "_nfs_host",
+        "_nfs_port",
+        "_max_connections",
+        "_max_keepalive",
+        "_prewarm",
+        "_ssl_context",
+        "_client",
+        "_workspace",
+        "_sandbox",
+        "_process",
+        "_pty",
+        "_nfs",
+    )
 
     def __init__(
         self,
@@ -23,6 +57,10 @@ class WorkspaceClient:
         timeout: float = 30.0,
         nfs_host: Optional[str] = None,
         nfs_port: int = 2049,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive: int = DEFAULT_MAX_KEEPALIVE,
+        prewarm: bool = False,
+        ssl_context: Optional[ssl.SSLContext] = None,
     ):
         """
         Initialize the workspace client.
@@ -33,39 +71,62 @@ class WorkspaceClient:
             timeout: Request timeout in seconds (default: 30)
             nfs_host: NFS server host for mounting workspaces (optional)
             nfs_port: NFS server port (default: 2049)
+            max_connections: Maximum number of pooled connections (default: 200)
+            max_keepalive: Maximum number of idle keep-alive connections (default: 100)
+            prewarm: Open a pooled connection on enter by requesting ``/health``
+                with a short timeout, so the first real call does not pay for
+                TCP/TLS setup. Blocks ``__enter__`` (default: False)
+            ssl_context: SSL context for HTTPS connections, e.g. one loaded with
+                a client certificate for mutual TLS (default: a shared context
+                with httpx's default CA bundle)
         """
         self._api_url = api_url
+        self._base_url = api_base_url(api_url)
         self._api_key = api_key
+        self._auth = BearerAuth(api_key) if api_key else None
         self._timeout = timeout
         self._nfs_host = nfs_host
         self._nfs_port = nfs_port
+        self._max_connections = max_connections
+        self._max_keepalive = max_keepalive
+        self._prewarm = prewarm
+        self._ssl_context = ssl_context
         self._client: Optional[httpx.Client] = None
 
         # Services will be initialized when context manager is entered
-        self.workspace: WorkspaceService
-        self.sandbox: SandboxService
-        self.process: ProcessService
-        self.pty: PtyService
-        self.nfs: NfsService
+        self._workspace: Optional[WorkspaceService] = None
+        self._sandbox: Optional[SandboxService] = None
+        self._process: Optional[ProcessService] = None
+        self._pty: Optional[PtyService] = None
+        self._nfs: Optional[NfsService] = None
 
     def __enter__(self) -> "WorkspaceClient":
         """Enter context manager"""
-        headers = {"Content-Type": "application/json"}
-        if self._api_key:
-            headers["Authorization"] = f"Bearer {self._api_key}"
-
-        self._client = httpx.Client(
-            base_url=f"{self._api_url}/api/v1",
-            headers=headers,
+        self._client = JsonClient(
+            base_url=self._base_url,
+            headers=ACCEPT_HEADERS,
+            auth=self._auth,
             timeout=self._timeout,
+            transport=build_transport(
+                self._max_connections,
+                self._max_keepalive,
+                ssl_context=self._ssl_context,
+            ),
         )
 
         # Initialize services
-        self.workspace = WorkspaceService(self._client, self._api_url)
-        self.sandbox = SandboxService(self._client, self._api_url)
-        self.process = ProcessService(self._client, self._api_url)
-        self.pty = PtyService(self._client, self._api_url)
-        self.nfs = NfsService(self._nfs_host, self._nfs_port)
+        self._workspace = WorkspaceService(self._client, self._base_url)
+        self._sandbox = SandboxService(self._client, self._base_url)
+        self._process = ProcessService(self._client, self._base_url)
+        self._pty = PtyService(self._client, self._base_url)
+        self._nfs = NfsService(self._nfs_host, self._nfs_port)
+
+        if self._prewarm:
+            try:
+                self._client.get("/health", timeout=PREWARM_TIMEOUT)
+            except httpx.HTTPError:
+                # Best effort: the first real request will surface any problem
+                pass
 
         return self
 
@@ -74,14 +135,50 @@ class WorkspaceClient:
         if self._client:
             self._client.close()
             self._client = None
+        self._workspace = self._sandbox = self._process = self._pty = self._nfs = None
+
+    @property
+    def workspace(self) -> WorkspaceService:
+        """Workspace and file operations"""
+        if self._workspace is None:
+            raise ClientNotOpenError("with")
+        return self._workspace
+
+    @property
+    def sandbox(self) -> SandboxService:
+        """Sandbox lifecycle operations"""
+        if self._sandbox is None:
+            raise ClientNotOpenError("with")
+        return self._sandbox
+
+    @property
+    def process(self) -> ProcessService:
+        """Command execution"""
+        if self._process is None:
+            raise ClientNotOpenError("with")
+        return self._process
+
+    @property
+    def pty(self) -> PtyService:
+        """Terminal sessions"""
+        if self._pty is None:
+            raise ClientNotOpenError("with")
+        return self._pty
+
+    @property
+    def nfs(self) -> NfsService:
+        """NFS mounting of workspaces"""
+        if self._nfs is None:
+            raise ClientNotOpenError("with")
+        return self._nfs
 
     def health(self) -> dict:
         """Check if the server is healthy"""
         if not self._client:
-            raise RuntimeError("Client not initialized. Use 'with' context manager.")
+            raise ClientNotOpenError("with")
         response = self._client.get("/health")
         response.raise_for_status()
-        return response.json()
+        return loads(response.content)
 
     @staticmethod
     def create(
@@ -90,6 +187,10 @@ class WorkspaceClient:
         timeout: float = 30.0,
         nfs_host: Optional[str] = None,
         nfs_port: int = 2049,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive: int = DEFAULT_MAX_KEEPALIVE,
+        prewarm: bool = False,
+        ssl_context: Optional[ssl.SSLContext] = None,
     ) -> "WorkspaceClient":
         """
         Factory method to create a WorkspaceClient.
@@ -99,4 +200,14 @@ class WorkspaceClient:
                 workspace = client.workspace.create()
                 sandbox = client.sandbox.create(CreateSandboxParams(workspace_id=workspace.id))
         """
-        return WorkspaceClient(api_url, api_key, timeout, nfs_host, nfs_port)
+        return WorkspaceClient(
+            api_url,
+            api_key,
+            timeout,
+            nfs_host,
+            nfs_port,
+            max_connections,
+            max_keepalive,
+            prewarm,
+            ssl_context,
+        )
@@ -75,23 +75,43 @@ class AgentNotConnectedError(WorkspaceError):
         self.sandbox_id = sandbox_id
 
 
+class ClientNotOpenError(WorkspaceError, RuntimeError):
+    """Client used outside of its context manager"""
+
+    def __init__(self, hint: str = "with"):
+        super().__init__(f"Client not initialized. Use '{hint}' context manager.", 1000)
+
+
+# Error code -> (error class, message prefix before the resource ID).
+# A prefix of None marks errors that carry no resource ID.
+_ERROR_CLASSES = {
+    2001: (SandboxNotFoundError, "Sandbox not found: "),
+    2003: (TemplateNotFoundError, "Template not found: "),
+    3001: (FileNotFoundError, "File not found: "),
+    3003: (PermissionDeniedError, "Permission denied: "),
+    4002: (ProcessTimeoutError, None),
+    4101: (PtyNotFoundError, "PTY not found: "),
+    5001: (AgentNotConnectedError, "Agent not connected for sandbox: "),
+}
+
+
 def parse_error_response(response_data: dict) -> WorkspaceError:
     """Parse error response from API into appropriate error class"""
     code = response_data.get("code", 1000)
-    message = response_data.get("message", "Unknown error")
-    details = response_data.get("details")
-
-    error_map = {
-        2001: lambda: SandboxNotFoundError(message.replace("Sandbox not found: ", "")),
-        2003: lambda: TemplateNotFoundError(message.replace("Template not found: ", "")),
-        3001: lambda: FileNotFoundError(message.replace("File not found: ", "")),
-        3003: lambda: PermissionDeniedError(message.replace("Permission denied: ", "")),
-        4002: lambda: ProcessTimeoutError(),
-        4101: lambda: PtyNotFoundError(message.replace("PTY not found: ", "")),
-        5001: lambda: AgentNotConnectedError(message.replace("Agent not connected for sandbox: ", "")),
-    }
-
-    if code in error_map:
-        return error_map[code]()
-
-    return WorkspaceError(message, code, details)
+    entry = _ERROR_CLASSES.get(code)
+    if entry is None:
+        return WorkspaceError(
+            response_data.get("message", "Unknown error"),
+            code,
+            response_data.get("details"),
+        )
+
+    error_class, prefix = entry
+    if prefix is None:
+        return error_class()
+
+    resource_id = response_data.get("resource_id")
+    if resource_id is None:
+        # Servers that predate resource_id only embed it in the message
+        resource_id = response_data.get("message", "").removeprefix(prefix)
+    return error_class(resource_id)
@@ -0,0 +1,81 @@
+"""
+Event loop helpers for the async SDK
+"""
+
+import asyncio
+import sys
+from typing import Any, Awaitable, Iterable, List, Optional
+
+
+def install_uvloop() -> bool:
+    """
+    Install uvloop as the asyncio event loop policy when it is available.
+
+    Call this before ``asyncio.run()`` so the loop driving the async client
+    is a uvloop loop. Install the optional dependency with
+    ``pip install workspace-sdk[fast]``.
+
+    Returns:
+        True if uvloop's policy is active, False if uvloop is unavailable
+        (not installed, or running on Windows)
+    """
+    if sys.platform == "win32":
+        return False
+    try:
+        import uvloop
+    except ImportError:
+        return False
+
+    if not isinstance(asyncio.get_event_loop_policy(), uvloop.EventLoopPolicy):
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+
+async def taskgroup_gather(
+    aws: Iterable[Awaitable[Any]],
+    max_concurrency: Optional[int] = None,
+) -> List[Any]:
+    """
+    Run awaitables concurrently in an ``asyncio.TaskGroup`` and return their results in order.
+
+    Unlike ``asyncio.gather``, the first failure cancels the remaining tasks
+    instead of leaving them running in the background. The first exception
+    is then raised as is, never wrapped in an ``ExceptionGroup``, on every
+    Python version.
+
+    Args:
+        aws: Awaitables to run
+        max_concurrency: Maximum number of awaitables running at once
+            (default: unbounded)
+
+    Usage:
+        sandboxes = await taskgroup_gather(
+            (client.sandbox.create(params) for _ in range(100)),
+            max_concurrency=20,
+        )
+    """
+    limiter = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+
+    async def run(aw: Awaitable[Any]) -> Any:
+        if limiter is None:
+            return await aw
+        async with limiter:
+            return await aw
+
+    if sys.version_info >= (3, 11):
+        try:
+            async with asyncio.TaskGroup() as tg:
+                tasks = [tg.create_task(run(aw)) for aw in aws]
+        except BaseExceptionGroup as group:  # noqa: F821 (builtin on 3.11+)
+            # Same contract as the gather path below: the first failure
+            raise group.exceptions[0] from None
+        return [task.result() for task in tasks]
+
+    tasks = [asyncio.ensure_future(run(aw)) for aw in aws]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
@@ -0,0 +1,75 @@
+"""
+JSON (de)serialization for SDK requests and responses
+
+Uses orjson when it is installed (``pip install workspace-sdk[fast]``) and
+falls back to the standard library otherwise.
+"""
+
+from typing import Any, Optional
+
+import httpx
+
+try:
+    import orjson
+
+    def dumps(obj: Any) -> bytes:
+        """Serialize an object to compact JSON bytes"""
+        return orjson.dumps(obj)
+
+    loads = orjson.loads
+except ImportError:
+    import json
+
+    def dumps(obj: Any) -> bytes:
+        """Serialize an object to compact JSON bytes"""
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    loads = json.loads
+
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def _encode_json(json: Any, content: Any, headers: Optional[Any]) -> tuple:
+    """Pre-encode a ``json=`` request body with the SDK serializer"""
+    if json is None:
+        return content, headers
+    if headers:
+        headers = httpx.Headers(headers)
+        headers.setdefault("Content-Type", "application/json")
+        return dumps(json), headers
+    return dumps(json), JSON_HEADERS
+
+
+class JsonClient(httpx.Client):
+    """httpx.Client that encodes ``json=`` bodies with the SDK serializer"""
+
+    def build_request(  # type: ignore[override]
+        self,
+        method: str,
+        url: Any,
+        *,
+        json: Any = None,
+        content: Any = None,
+        headers: Any = None,
+        **kwargs: Any,
+    ) -> httpx.Request:
+        content, headers = _encode_json(json, content, headers)
+        return super().build_request(method, url, content=content, headers=headers, **kwargs)
+
+
+class AsyncJsonClient(httpx.AsyncClient):
+    """httpx.AsyncClient that encodes ``json=`` bodies with the SDK serializer"""
+
+    def build_request(  # type: ignore[override]
+        self,
+        method: str,
+        url: Any,
+        *,
+        json: Any = None,
+        content: Any = None,
+        headers: Any = None,
+        **kwargs: Any,
+    ) -> httpx.Request:
+        content, headers = _encode_json(json, content, headers)
+        return super().build_request(method, url, content=content, headers=headers, **kwargs)
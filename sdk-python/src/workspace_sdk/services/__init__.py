@@ -4,7 +4,12 @@ Services module for the Workspace SDK
 
 from workspace_sdk.services.workspace import WorkspaceService, AsyncWorkspaceService
 from workspace_sdk.services.sandbox import SandboxService, AsyncSandboxService
-from workspace_sdk.services.process import ProcessService, AsyncProcessService
+from workspace_sdk.services.process import (
+    ProcessService,
+    AsyncProcessService,
+    ProcessEventStream,
+    AsyncProcessEventStream,
+)
 from workspace_sdk.services.pty import PtyService, AsyncPtyService
 from workspace_sdk.services.nfs import NfsService, NfsMount
 
@@ -15,6 +20,8 @@ __all__ = [
     "AsyncSandboxService",
     "ProcessService",
     "AsyncProcessService",
+    "ProcessEventStream",
+    "AsyncProcessEventStream",
     "PtyService",
     "AsyncPtyService",
     "NfsService",
@@ -3,15 +3,83 @@ NFS service for mounting sandbox workspaces
 """
 
 import os
+import shutil
 import subprocess
 import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
-from urllib.parse import urlparse
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+from urllib.parse import ParseResult, urlparse
+
+
+DEFAULT_MOUNT_OPTIONS = "nfsvers=3,tcp,nolock,port={port},mountport={port}"
+COPY_CONCURRENCY = 64
+
+MountKey = Tuple[str, int, str]
+
+# Guards the shared mount registry, the user counts of registered mounts and
+# _busy. Never held while mount/umount runs.
+_registry_lock = threading.Lock()
+
+# Exports whose NFS mount or unmount is running; set once it has finished, so
+# other mounts of the same export wait and then look at the registry again
+_busy: Dict[MountKey, threading.Event] = {}
+
+
+def _copy_plan(
+    sources: Iterable[Union[str, Path]], target: Path
+) -> Tuple[List[Path], List[Tuple[int, Path, Path]]]:
+    """Expand sources into directories to create and (inode, src, dst) file copies
+
+    Symlinks, including ones to directories and dangling ones, are planned as
+    single entries so they are recreated as links rather than followed.
+    """
+    dirs: List[Path] = []
+    files: List[Tuple[int, Path, Path]] = []
+    for source in map(Path, sources):
+        base = target / source.name
+        if source.is_symlink() or not source.is_dir():
+            files.append((source.lstat().st_ino, source, base))
+            continue
+        dirs.append(base)
+        for root, subdirs, names in os.walk(source):
+            rel = Path(root).relative_to(source)
+            # os.walk lists symlinks to directories as subdirs without
+            # descending into them; copy those as links too
+            for name in subdirs:
+                src = Path(root, name)
+                if src.is_symlink():
+                    files.append((src.lstat().st_ino, src, base / rel / name))
+                else:
+                    dirs.append(base / rel / name)
+            for name in names:
+                src = Path(root, name)
+                files.append((src.lstat().st_ino, src, base / rel / name))
+    return dirs, files
+
+
+def _copy_entry(entry: Tuple[int, Path, Path]) -> Path:
+    """Copy one planned file, recreating symlinks as links"""
+    _, src, dst = entry
+    return Path(shutil.copy2(src, dst, follow_symlinks=False))
+
+
+@lru_cache(maxsize=128)
+def _parse_nfs_url(nfs_url: str) -> ParseResult:
+    """Parse an nfs://host:port/path URL; bulk mounts often repeat the same one"""
+    return urlparse(nfs_url)
 
 
 class NfsMount:
-    """Context manager for NFS mount"""
+    """Context manager for NFS mount
+
+    Mounts created with a shared registry (as ``NfsService.mount`` does) reuse
+    an export that is already mounted in this process: later mounts of the
+    same ``(host, port, export_path)`` are bind mounts of the first one, and
+    the NFS mount itself is released when its last user unmounts.
+    """
 
     def __init__(
         self,
@@ -20,6 +88,7 @@ class NfsMount:
         export_path: str,
         mount_point: Optional[str] = None,
         options: Optional[str] = None,
+        registry: Optional[Dict[MountKey, "NfsMount"]] = None,
     ):
         self.host = host
         self.port = port
@@ -27,7 +96,18 @@ class NfsMount:
         self._mount_point = mount_point
         self._temp_dir: Optional[tempfile.TemporaryDirectory] = None
         self._mounted = False
-        self.options = options or "nfsvers=3,tcp,nolock,port={port},mountport={port}"
+        # Resolve the {port} placeholder once rather than on every mount()
+        self.options = (options or DEFAULT_MOUNT_OPTIONS).format(port=port)
+        self._registry = registry
+        # The shared mount this one is bound from, if any
+        self._source: Optional[NfsMount] = None
+        # Active users of this NFS mount, including itself
+        self._users = 0
+
+    @property
+    def key(self) -> MountKey:
+        """The ``(host, port, export_path)`` identifying the export"""
+        return (self.host, self.port, self.export_path)
 
     @property
     def mount_point(self) -> str:
@@ -48,6 +128,48 @@ class NfsMount:
         if self._mounted:
             return self.mount_point
 
+        source = None
+        if self._registry is not None:
+            while True:
+                with _registry_lock:
+                    busy = _busy.get(self.key)
+                    if busy is None:
+                        source = self._registry.get(self.key)
+                        if source is self:
+                            # Unmounted while bind mounts kept the share alive
+                            self._mounted = True
+                            self._users += 1
+                            return self.mount_point
+                        if source is not None:
+                            # Keep the share mounted until the bind is made
+                            source._users += 1
+                        else:
+                            _busy[self.key] = threading.Event()
+                        break
+                busy.wait()
+
+        try:
+            mount_path = self._mount_at(source)
+        except BaseException:
+            if source is not None:
+                source._release()
+            else:
+                self._finish_busy()
+            raise
+
+        self._mounted = True
+        if source is not None:
+            self._source = source
+        else:
+            with _registry_lock:
+                self._users += 1
+                if self._registry is not None:
+                    self._registry[self.key] = self
+            self._finish_busy()
+        return mount_path
+
+    def _mount_at(self, source: Optional["NfsMount"]) -> str:
+        """Mount the share, or bind-mount ``source``, at this mount point"""
         # Create mount point if not specified
         if not self._mount_point:
             self._temp_dir = tempfile.TemporaryDirectory(prefix="workspace_nfs_")
@@ -56,33 +178,103 @@ class NfsMount:
             mount_path = self._mount_point
             Path(mount_path).mkdir(parents=True, exist_ok=True)
 
-        # Build mount options
-        opts = self.options.format(port=self.port)
-
         # Mount command
-        cmd = [
-            "mount",
-            "-t", "nfs",
-            "-o", opts,
-            f"{self.host}:{self.export_path}",
-            mount_path,
-        ]
+        if source is not None:
+            cmd = ["mount", "--bind", source.mount_point, mount_path]
+        else:
+            cmd = [
+                "mount",
+                "-t", "nfs",
+                "-o", self.options,
+                f"{self.host}:{self.export_path}",
+                mount_path,
+            ]
 
         try:
             subprocess.run(cmd, check=True, capture_output=True, text=True)
-            self._mounted = True
-            return mount_path
         except subprocess.CalledProcessError as e:
-            if self._temp_dir:
-                self._temp_dir.cleanup()
-                self._temp_dir = None
+            self._cleanup_temp_dir()
             raise RuntimeError(f"Failed to mount NFS: {e.stderr}") from e
+        return mount_path
+
+    def _finish_busy(self) -> None:
+        """Wake mounts waiting on this export's mount or unmount"""
+        if self._registry is None:
+            return
+        with _registry_lock:
+            busy = _busy.pop(self.key, None)
+        if busy is not None:
+            busy.set()
+
+    def copy_into(
+        self,
+        dst: Union[str, Path],
+        paths: Iterable[Union[str, Path]],
+        max_workers: int = COPY_CONCURRENCY,
+    ) -> List[Path]:
+        """
+        Copy local files and directories into the mounted share.
+
+        Copying is dominated by per-file round trips to the NFS server, so
+        files are copied by a thread pool to overlap that latency, in inode
+        order so the source side is read close to sequentially.
+
+        Args:
+            dst: Destination directory, relative to the mount point
+            paths: Local files or directories; directories are copied
+                recursively and symlinks are copied as symlinks
+            max_workers: Maximum number of files copied at once (default: 64)
+
+        Returns:
+            The destination path of every copied file
+        """
+        target = Path(self.mount_point, dst)
+        dirs, files = _copy_plan(paths, target)
+        target.mkdir(parents=True, exist_ok=True)
+        for directory in dirs:
+            directory.mkdir(parents=True, exist_ok=True)
+
+        files.sort()
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return list(pool.map(_copy_entry, files))
 
     def unmount(self) -> None:
         """Unmount the NFS share"""
         if not self._mounted:
             return
 
+        with _registry_lock:
+            self._mounted = False
+            source, self._source = self._source, None
+        if source is None:
+            self._release()
+            return
+        try:
+            self._umount()
+        finally:
+            self._cleanup_temp_dir()
+            source._release()
+
+    def _release(self) -> None:
+        """Drop one user of this NFS mount, unmounting it after the last"""
+        with _registry_lock:
+            self._users -= 1
+            if self._users > 0:
+                return
+            registered = self._registry is not None and self._registry.get(self.key) is self
+            if registered:
+                # Mounts of this export wait for the unmount, then mount afresh
+                del self._registry[self.key]
+                _busy[self.key] = threading.Event()
+        try:
+            self._umount()
+        finally:
+            self._cleanup_temp_dir()
+            if registered:
+                self._finish_busy()
+
+    def _umount(self) -> None:
+        """Run umount on the mount point, falling back to a lazy unmount"""
         try:
             subprocess.run(
                 ["umount", self.mount_point],
@@ -90,7 +282,7 @@ class NfsMount:
                 capture_output=True,
                 text=True,
             )
-        except subprocess.CalledProcessError as e:
+        except subprocess.CalledProcessError:
             # Try lazy unmount
             try:
                 subprocess.run(
@@ -101,11 +293,11 @@ class NfsMount:
                 )
             except subprocess.CalledProcessError:
                 pass
-        finally:
-            self._mounted = False
-            if self._temp_dir:
-                self._temp_dir.cleanup()
-                self._temp_dir = None
+
+    def _cleanup_temp_dir(self) -> None:
+        if self._temp_dir:
+            self._temp_dir.cleanup()
+            self._temp_dir = None
 
     def __enter__(self) -> "NfsMount":
         self.mount()
@@ -118,6 +310,9 @@ class NfsMount:
 class NfsService:
     """Service for managing NFS mounts for sandbox workspaces"""
 
+    # Exports currently mounted by this process, shared by every NfsService
+    _shared: Dict[MountKey, NfsMount] = {}
+
     def __init__(self, default_host: Optional[str] = None, default_port: int = 2049):
         """
         Initialize NFS service.
@@ -148,7 +343,8 @@ class NfsService:
             nfs_url: Full NFS URL (overrides host/port/sandbox_id if provided)
 
         Returns:
-            NfsMount context manager
+            NfsMount context manager; if the export is already mounted by this
+            process, entering it bind-mounts the existing mount point
 
         Example:
             with nfs.mount("sandbox-123") as mount:
@@ -158,7 +354,7 @@ class NfsService:
         """
         if nfs_url:
             # Parse nfs://host:port/path URL
-            parsed = urlparse(nfs_url)
+            parsed = _parse_nfs_url(nfs_url)
             host = parsed.hostname or self.default_host
             port = parsed.port or self.default_port
             export_path = parsed.path
@@ -175,17 +371,18 @@ class NfsService:
             port=port,
             export_path=export_path,
             mount_point=mount_point,
+            registry=self._shared,
         )
 
     @staticmethod
+    @lru_cache(maxsize=1)
     def is_available() -> bool:
-        """Check if NFS mount is available on this system"""
-        try:
-            result = subprocess.run(
-                ["which", "mount.nfs"],
-                capture_output=True,
-                text=True,
-            )
-            return result.returncode == 0
-        except Exception:
-            return False
+        """
+        Check if NFS mount is available on this system.
+
+        The result is computed once per process.
+        """
+        search_path = os.pathsep.join(
+            [os.environ.get("PATH", os.defpath), "/sbin", "/usr/sbin"]
+        )
+        return shutil.which("mount.nfs", path=search_path) is not None
@@ -2,10 +2,15 @@
 Process service for executing commands
 """
 
-from typing import Optional, AsyncIterator, Iterator
-import json
+from contextlib import AsyncExitStack, ExitStack
+from functools import lru_cache
+from typing import Any, AsyncGenerator, Callable, Dict, Generator, Iterable, List, Optional, Tuple
+import asyncio
 import httpx
 
+from workspace_sdk.eventloop import taskgroup_gather
+from workspace_sdk.serialization import JSON_HEADERS, dumps, loads
+from workspace_sdk.sse import SSEDecoder
 from workspace_sdk.types import (
     CommandResult,
     RunCommandOptions,
@@ -16,13 +21,146 @@ from workspace_sdk.types import (
     ErrorEvent,
 )
 
+# Requests in flight at once for run_many / kill_many
+BULK_CONCURRENCY = 32
+
+
+def _run_body(command: str, options: Optional[RunCommandOptions]) -> bytes:
+    """Build the JSON body for ``/process/run``"""
+    # Not memoized: a cache would keep env values such as secrets alive
+    if options is None:
+        return dumps({"command": command, "args": (), "env": {}})
+    data: Dict[str, Any] = {
+        "command": command,
+        "args": options.args or (),
+        "env": options.env or {},
+    }
+    if options.cwd:
+        data["cwd"] = options.cwd
+    if options.timeout:
+        data["timeout"] = options.timeout
+    return dumps(data)
+
+
+# Parsed events an async run_stream reads ahead of a slow consumer
+STREAM_QUEUE_SIZE = 64
+
+# Queued by the stream reader task after the last event
+_END_OF_STREAM = object()
+
+# Pre-encoded query values for commands without args or env
+_EMPTY_ARGS_JSON = "[]"
+_EMPTY_ENV_JSON = "{}"
+
+
+@lru_cache(maxsize=512)
+def _args_json(args: Tuple[str, ...]) -> str:
+    """JSON-encode stream args; repeated argument lists reuse the cached string"""
+    return dumps(args).decode()
+
+
+def _stream_params(command: str, options: Optional[RunCommandOptions]) -> Dict[str, str]:
+    """Build the query parameters for ``/process/run/stream``"""
+    if options is None:
+        return {"command": command, "args": _EMPTY_ARGS_JSON, "env": _EMPTY_ENV_JSON}
+    params = {
+        "command": command,
+        "args": _args_json(options.args) if options.args else _EMPTY_ARGS_JSON,
+        # Encoded per call: caching env would keep values such as secrets alive
+        "env": dumps(options.env).decode() if options.env else _EMPTY_ENV_JSON,
+    }
+    if options.cwd:
+        params["cwd"] = options.cwd
+    if options.timeout:
+        params["timeout"] = str(options.timeout)
+    return params
+
+
+# Event constructor for each event type, looked up by the payload's tag
+_EVENT_BUILDERS: Dict[str, Callable[[dict], ProcessEvent]] = {
+    "stdout": lambda data: StdoutEvent(data["data"]),
+    "stderr": lambda data: StderrEvent(data["data"]),
+    "exit": lambda data: ExitEvent(data["code"]),
+    "error": lambda data: ErrorEvent(data["message"]),
+}
+
+
+def _event_from_sse(sse_event: str, data: dict) -> Optional[ProcessEvent]:
+    """Parse event data into ProcessEvent"""
+    # The JSON "type" wins; the SSE event name covers payloads without one
+    build = _EVENT_BUILDERS.get(data.get("type", sse_event))
+    return build(data) if build is not None else None
+
+
+class AsyncProcessEventStream:
+    """Async iterator over process events that owns the underlying SSE connection
+
+    Use it as an async context manager (or call ``aclose()``) so breaking out
+    of the loop early releases the connection immediately:
+
+        async with client.process.run_stream(sandbox_id, "make") as events:
+            async for event in events:
+                ...
+    """
+
+    def __init__(self, events: AsyncGenerator[ProcessEvent, None]):
+        self._events = events
+
+    def __aiter__(self) -> "AsyncProcessEventStream":
+        return self
+
+    async def __anext__(self) -> ProcessEvent:
+        return await self._events.__anext__()
+
+    async def aclose(self) -> None:
+        """Close the stream and its HTTP response"""
+        await self._events.aclose()
+
+    async def __aenter__(self) -> "AsyncProcessEventStream":
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        await self.aclose()
+
+
+class ProcessEventStream:
+    """Iterator over process events that owns the underlying SSE connection
+
+    Use it as a context manager (or call ``close()``) so breaking out of the
+    loop early releases the connection immediately:
+
+        with client.process.run_stream(sandbox_id, "make") as events:
+            for event in events:
+                ...
+    """
+
+    def __init__(self, events: Generator[ProcessEvent, None, None]):
+        self._events = events
+
+    def __iter__(self) -> "ProcessEventStream":
+        return self
+
+    def __next__(self) -> ProcessEvent:
+        return next(self._events)
+
+    def close(self) -> None:
+        """Close the stream and its HTTP response"""
+        self._events.close()
+
+    def __enter__(self) -> "ProcessEventStream":
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        self.close()
+
 
 class AsyncProcessService:
     """Async service for executing commands in sandboxes"""
 
-    def __init__(self, client: httpx.AsyncClient, api_url: str):
+    def __init__(self, client: httpx.AsyncClient, base_url: str):
         self._client = client
-        self._api_url = api_url
+        self._base_url = base_url
+        self._stream_post_supported = True
 
     async def run(
         self,
@@ -31,57 +169,102 @@ class AsyncProcessService:
         options: Optional[RunCommandOptions] = None,
     ) -> CommandResult:
         """Run a command and wait for completion"""
-        data = {
-            "command": command,
-            "args": options.args if options and options.args else [],
-            "env": options.env if options and options.env else {},
-        }
-        if options and options.cwd:
-            data["cwd"] = options.cwd
-        if options and options.timeout:
-            data["timeout"] = options.timeout
-
         response = await self._client.post(
             f"/sandboxes/{sandbox_id}/process/run",
-            json=data,
+            content=_run_body(command, options),
+            headers=JSON_HEADERS,
         )
         response.raise_for_status()
-        result = response.json()
+        result = loads(response.content)
+
+        return CommandResult(result["exit_code"], result["stdout"], result["stderr"])
+
+    async def run_many(
+        self,
+        sandbox_id: str,
+        commands: Iterable[str],
+        options: Optional[RunCommandOptions] = None,
+        max_concurrency: int = BULK_CONCURRENCY,
+    ) -> List[CommandResult]:
+        """
+        Run several commands concurrently and return their results in order.
 
-        return CommandResult(
-            exit_code=result["exit_code"],
-            stdout=result["stdout"],
-            stderr=result["stderr"],
+        Each command is scheduled as a task in one ``asyncio.TaskGroup`` via
+        ``taskgroup_gather``; the first failure cancels the remaining commands
+        and is raised as is, not as an ``ExceptionGroup``.
+        """
+        return await taskgroup_gather(
+            (self.run(sandbox_id, command, options) for command in commands),
+            max_concurrency=max_concurrency,
         )
 
-    async def run_stream(
+    def run_stream(
         self,
         sandbox_id: str,
         command: str,
         options: Optional[RunCommandOptions] = None,
-    ) -> AsyncIterator[ProcessEvent]:
+    ) -> AsyncProcessEventStream:
         """Run a command with streaming output"""
-        params = {
-            "command": command,
-            "args": json.dumps(options.args if options and options.args else []),
-            "env": json.dumps(options.env if options and options.env else {}),
-        }
-        if options and options.cwd:
-            params["cwd"] = options.cwd
-        if options and options.timeout:
-            params["timeout"] = str(options.timeout)
-
-        url = f"{self._api_url}/api/v1/sandboxes/{sandbox_id}/process/run/stream"
-
-        async with httpx.AsyncClient() as stream_client:
-            async with stream_client.stream("GET", url, params=params) as response:
-                response.raise_for_status()
-                async for line in response.aiter_lines():
-                    if line.startswith("data: "):
-                        data = json.loads(line[6:])
-                        event = self._parse_event(data)
-                        if event:
-                            yield event
+        return AsyncProcessEventStream(self._stream_events(sandbox_id, command, options))
+
+    async def _stream_events(
+        self,
+        sandbox_id: str,
+        command: str,
+        options: Optional[RunCommandOptions],
+    ) -> AsyncGenerator[ProcessEvent, None]:
+        path = f"/sandboxes/{sandbox_id}/process/run/stream"
+
+        async with AsyncExitStack() as stack:
+            # Stream over the shared client so the pooled (HTTP/2) connection,
+            # auth and timeouts are reused
+            response = None
+            if self._stream_post_supported:
+                response = await stack.enter_async_context(
+                    self._client.stream(
+                        "POST", path, content=_run_body(command, options), headers=JSON_HEADERS
+                    )
+                )
+                if response.status_code == 405:
+                    # Server only accepts the query-string form
+                    self._stream_post_supported = False
+                    await response.aclose()
+                    response = None
+            if response is None:
+                response = await stack.enter_async_context(
+                    self._client.stream("GET", path, params=_stream_params(command, options))
+                )
+            response.raise_for_status()
+
+            # A reader task keeps draining the socket while the consumer is
+            # busy, up to STREAM_QUEUE_SIZE parsed events ahead
+            queue: asyncio.Queue = asyncio.Queue(maxsize=STREAM_QUEUE_SIZE)
+
+            async def reader() -> None:
+                decoder = SSEDecoder()
+                try:
+                    async for chunk in response.aiter_bytes():
+                        for sse in decoder.feed(chunk):
+                            event = self._parse_event(sse.event, loads(sse.data))
+                            if event:
+                                await queue.put(event)
+                except Exception as e:
+                    await queue.put(e)
+                else:
+                    await queue.put(_END_OF_STREAM)
+
+            reader_task = asyncio.create_task(reader())
+            try:
+                while True:
+                    item = await queue.get()
+                    if item is _END_OF_STREAM:
+                        return
+                    if isinstance(item, Exception):
+                        raise item
+                    yield item
+            finally:
+                reader_task.cancel()
+                await asyncio.gather(reader_task, return_exceptions=True)
 
     async def kill(
         self,
@@ -92,30 +275,41 @@ class AsyncProcessService:
         """Kill a running process"""
         response = await self._client.post(
             f"/sandboxes/{sandbox_id}/process/{pid}/kill",
-            json={"signal": signal},
+            content=dumps({"signal": signal}),
+            headers=JSON_HEADERS,
         )
         response.raise_for_status()
 
-    def _parse_event(self, data: dict) -> Optional[ProcessEvent]:
-        """Parse event data into ProcessEvent"""
-        event_type = data.get("type")
-        if event_type == "stdout":
-            return StdoutEvent(type="stdout", data=data["data"])
-        elif event_type == "stderr":
-            return StderrEvent(type="stderr", data=data["data"])
-        elif event_type == "exit":
-            return ExitEvent(type="exit", code=data["code"])
-        elif event_type == "error":
-            return ErrorEvent(type="error", message=data["message"])
-        return None
+    async def kill_many(
+        self,
+        sandbox_id: str,
+        pids: Iterable[int],
+        signal: int = 15,
+        max_concurrency: int = BULK_CONCURRENCY,
+    ) -> None:
+        """
+        Kill several processes concurrently.
+
+        The requests multiplex over the client's pooled (HTTP/2) connection
+        instead of paying one round trip after another; the first failure
+        cancels the remaining requests and is raised as is, not as an
+        ``ExceptionGroup``.
+        """
+        await taskgroup_gather(
+            (self.kill(sandbox_id, pid, signal) for pid in pids),
+            max_concurrency=max_concurrency,
+        )
+
+    _parse_event = staticmethod(_event_from_sse)
 
 
 class ProcessService:
     """Sync service for executing commands in sandboxes"""
 
-    def __init__(self, client: httpx.Client, api_url: str):
+    def __init__(self, client: httpx.Client, base_url: str):
         self._client = client
-        self._api_url = api_url
+        self._base_url = base_url
+        self._stream_post_supported = True
 
     def run(
         self,
@@ -124,57 +318,60 @@ class ProcessService:
         options: Optional[RunCommandOptions] = None,
     ) -> CommandResult:
         """Run a command and wait for completion"""
-        data = {
-            "command": command,
-            "args": options.args if options and options.args else [],
-            "env": options.env if options and options.env else {},
-        }
-        if options and options.cwd:
-            data["cwd"] = options.cwd
-        if options and options.timeout:
-            data["timeout"] = options.timeout
-
         response = self._client.post(
             f"/sandboxes/{sandbox_id}/process/run",
-            json=data,
+            content=_run_body(command, options),
+            headers=JSON_HEADERS,
         )
         response.raise_for_status()
-        result = response.json()
+        result = loads(response.content)
 
-        return CommandResult(
-            exit_code=result["exit_code"],
-            stdout=result["stdout"],
-            stderr=result["stderr"],
-        )
+        return CommandResult(result["exit_code"], result["stdout"], result["stderr"])
 
     def run_stream(
         self,
         sandbox_id: str,
         command: str,
         options: Optional[RunCommandOptions] = None,
-    ) -> Iterator[ProcessEvent]:
+    ) -> ProcessEventStream:
         """Run a command with streaming output"""
-        params = {
-            "command": command,
-            "args": json.dumps(options.args if options and options.args else []),
-            "env": json.dumps(options.env if options and options.env else {}),
-        }
-        if options and options.cwd:
-            params["cwd"] = options.cwd
-        if options and options.timeout:
-            params["timeout"] = str(options.timeout)
-
-        url = f"{self._api_url}/api/v1/sandboxes/{sandbox_id}/process/run/stream"
-
-        with httpx.Client() as stream_client:
-            with stream_client.stream("GET", url, params=params) as response:
-                response.raise_for_status()
-                for line in response.iter_lines():
-                    if line.startswith("data: "):
-                        data = json.loads(line[6:])
-                        event = self._parse_event(data)
-                        if event:
-                            yield event
+        return ProcessEventStream(self._stream_events(sandbox_id, command, options))
+
+    def _stream_events(
+        self,
+        sandbox_id: str,
+        command: str,
+        options: Optional[RunCommandOptions],
+    ) -> Generator[ProcessEvent, None, None]:
+        path = f"/sandboxes/{sandbox_id}/process/run/stream"
+
+        with ExitStack() as stack:
+            # Stream over the shared client so the pooled (HTTP/2) connection,
+            # auth and timeouts are reused
+            response = None
+            if self._stream_post_supported:
+                response = stack.enter_context(
+                    self._client.stream(
+                        "POST", path, content=_run_body(command, options), headers=JSON_HEADERS
+                    )
+                )
+                if response.status_code == 405:
+                    # Server only accepts the query-string form
+                    self._stream_post_supported = False
+                    response.close()
+                    response = None
+            if response is None:
+                response = stack.enter_context(
+                    self._client.stream("GET", path, params=_stream_params(command, options))
+                )
+            response.raise_for_status()
+
+            decoder = SSEDecoder()
+            for chunk in response.iter_bytes():
+                for sse in decoder.feed(chunk):
+                    event = self._parse_event(sse.event, loads(sse.data))
+                    if event:
+                        yield event
 
     def kill(
         self,
@@ -185,19 +382,9 @@ class ProcessService:
         """Kill a running process"""
         response = self._client.post(
             f"/sandboxes/{sandbox_id}/process/{pid}/kill",
-            json={"signal": signal},
+            content=dumps({"signal": signal}),
+            headers=JSON_HEADERS,
         )
         response.raise_for_status()
 
-    def _parse_event(self, data: dict) -> Optional[ProcessEvent]:
-        """Parse event data into ProcessEvent"""
-        event_type = data.get("type")
-        if event_type == "stdout":
-            return StdoutEvent(type="stdout", data=data["data"])
-        elif event_type == "stderr":
-            return StderrEvent(type="stderr", data=data["data"])
-        elif event_type == "exit":
-            return ExitEvent(type="exit", code=data["code"])
-        elif event_type == "error":
-            return ErrorEvent(type="error", message=data["message"])
-        return None
+    _parse_event = staticmethod(_event_from_sse)
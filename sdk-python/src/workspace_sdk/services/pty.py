@@ -2,20 +2,165 @@
 PTY service for interactive terminals
 """
 
-from typing import Optional, Callable
+from collections import deque
+from typing import Deque, Optional, Callable
+from urllib.parse import urlsplit, urlunsplit
 import asyncio
 import httpx
 import websockets
 
+from workspace_sdk.eventloop import install_uvloop
+from workspace_sdk.serialization import loads
 from workspace_sdk.types import PtyOptions, PtyHandle
 
 
+# Upper bound on PTY output buffered for read(); older output is dropped first
+PTY_READ_BUFFER_LIMIT = 1024 * 1024
+
+
+class _PtyReadBuffer:
+    """Single-consumer buffer for PTY output
+
+    A deque plus one waiter future instead of an asyncio.Queue: the producer
+    only wakes the reader when it is actually waiting, and a reader that falls
+    behind gets every pending chunk in one call. Once more than
+    ``PTY_READ_BUFFER_LIMIT`` bytes are unread the oldest chunks are dropped,
+    like terminal scrollback, so a PTY nobody reads cannot grow without bound.
+    """
+
+    def __init__(self) -> None:
+        self._chunks: Deque[bytes] = deque()
+        self._size = 0
+        self._waiter: Optional[asyncio.Future] = None
+        self._closed = False
+
+    def append(self, data: bytes) -> None:
+        chunks = self._chunks
+        chunks.append(data)
+        self._size += len(data)
+        while self._size > PTY_READ_BUFFER_LIMIT and len(chunks) > 1:
+            self._size -= len(chunks.popleft())
+        self._wake()
+
+    def close(self) -> None:
+        self._closed = True
+        self._wake()
+
+    def _wake(self) -> None:
+        waiter = self._waiter
+        self._waiter = None
+        if waiter is not None and not waiter.done():
+            waiter.set_result(None)
+
+    async def get(self) -> bytes:
+        """Return all buffered output, waiting for some if needed; b"" once closed"""
+        while not self._chunks:
+            if self._closed:
+                return b""
+            self._waiter = asyncio.get_running_loop().create_future()
+            await self._waiter
+
+        chunks = self._chunks
+        self._size = 0
+        if len(chunks) == 1:
+            return chunks.popleft()
+        data = b"".join(chunks)
+        chunks.clear()
+        return data
+
+
+# Upper bound on buffered, unsent PTY input and on the size of one frame
+PTY_WRITE_BUFFER_LIMIT = 64 * 1024
+
+
+class _PtyWriteBuffer:
+    """Coalesces PTY writes issued in the same event loop tick into one frame
+
+    ``write()`` only waits for the socket once more than
+    ``PTY_WRITE_BUFFER_LIMIT`` bytes are pending; a send failure is raised
+    from the next ``write()`` or ``drain()``.
+    """
+
+    def __init__(self, ws: "websockets.WebSocketClientProtocol"):
+        self._ws = ws
+        self._chunks: Deque[bytes] = deque()
+        self._size = 0
+        self._flush_task: Optional[asyncio.Task] = None
+        self._error: Optional[BaseException] = None
+
+    async def write(self, data: bytes) -> None:
+        if self._error is not None:
+            raise self._error
+        self._chunks.append(data)
+        self._size += len(data)
+        if self._flush_task is None:
+            self._flush_task = asyncio.get_running_loop().create_task(self._flush())
+        if self._size >= PTY_WRITE_BUFFER_LIMIT:
+            await self.drain()
+
+    async def drain(self) -> None:
+        """Wait until everything written so far has been sent"""
+        if self._flush_task is not None:
+            await asyncio.shield(self._flush_task)
+        if self._error is not None:
+            raise self._error
+
+    async def _flush(self) -> None:
+        chunks = self._chunks
+        try:
+            while chunks:
+                parts = []
+                size = 0
+                while chunks and size < PTY_WRITE_BUFFER_LIMIT:
+                    chunk = chunks.popleft()
+                    parts.append(chunk)
+                    size += len(chunk)
+                self._size -= size
+                await self._ws.send(parts[0] if len(parts) == 1 else b"".join(parts))
+        except Exception as e:
+            self._error = e
+            chunks.clear()
+            self._size = 0
+        finally:
+            self._flush_task = None
+
+
+# WebSocket scheme for each supported API URL scheme
+_WS_SCHEMES = {"http": "ws", "https": "wss", "ws": "ws", "wss": "wss"}
+
+
+def _ws_base_url(base_url: str) -> str:
+    """Rewrite the API base URL's scheme for WebSocket connections"""
+    parts = urlsplit(base_url)
+    scheme = _WS_SCHEMES.get(parts.scheme)
+    if scheme is None:
+        raise ValueError(f"Unsupported URL scheme for PTY connections: {base_url!r}")
+    return urlunsplit(parts._replace(scheme=scheme))
+
+
 class AsyncPtyService:
     """Async service for managing interactive terminals"""
 
-    def __init__(self, client: httpx.AsyncClient, api_url: str):
+    def __init__(self, client: httpx.AsyncClient, base_url: str):
+        """
+        Initialize the PTY service.
+
+        PTY sessions stream over WebSockets and benefit from running on uvloop;
+        call ``AsyncPtyService.install_uvloop()`` before ``asyncio.run()`` to
+        opt in.
+        """
         self._client = client
-        self._api_url = api_url
+        self._base_url = base_url
+        self._ws_base_url = _ws_base_url(base_url)
+
+    @staticmethod
+    def install_uvloop() -> bool:
+        """
+        Install uvloop as the event loop policy for PTY-heavy programs.
+
+        A no-op returning False when uvloop is unavailable or on Windows.
+        """
+        return install_uvloop()
 
     async def create(
         self,
@@ -38,38 +183,45 @@ class AsyncPtyService:
             json=data,
         )
         response.raise_for_status()
-        result = response.json()
+        result = loads(response.content)
 
         pty_id = result["id"]
         cols = result["cols"]
         rows = result["rows"]
 
         # Create WebSocket connection
-        ws_url = self._api_url.replace("http", "ws")
-        ws_uri = f"{ws_url}/api/v1/sandboxes/{sandbox_id}/pty/{pty_id}"
+        ws_uri = f"{self._ws_base_url}/sandboxes/{sandbox_id}/pty/{pty_id}"
 
-        ws = await websockets.connect(ws_uri)
+        # Terminal output is small, latency-sensitive frames; skip offering
+        # permessage-deflate so each frame is not run through zlib
+        ws = await websockets.connect(ws_uri, compression=None)
 
         data_callback: Optional[Callable[[bytes], None]] = None
         close_callback: Optional[Callable[[], None]] = None
+        read_buffer = _PtyReadBuffer()
 
         async def receive_loop() -> None:
             nonlocal data_callback, close_callback
             try:
                 async for message in ws:
-                    if isinstance(message, bytes) and data_callback:
-                        data_callback(message)
+                    if isinstance(message, bytes):
+                        # Output is buffered for read() until a callback is set
+                        if data_callback:
+                            data_callback(message)
+                        else:
+                            read_buffer.append(message)
             except websockets.ConnectionClosed:
                 pass
             finally:
+                read_buffer.close()
                 if close_callback:
                     close_callback()
 
-        # Start receive loop in background
-        asyncio.create_task(receive_loop())
+        # Start receive loop in background; keep a reference so it is not
+        # garbage collected while the PTY is open
+        receive_task = asyncio.create_task(receive_loop(), name=f"pty-recv-{pty_id}")
 
-        async def write(data: bytes) -> None:
-            await ws.send(data)
+        write_buffer = _PtyWriteBuffer(ws)
 
         async def resize(new_cols: int, new_rows: int) -> None:
             await self._client.post(
@@ -78,8 +230,19 @@ class AsyncPtyService:
             )
 
         async def kill() -> None:
-            await ws.close()
-            await self._client.delete(f"/sandboxes/{sandbox_id}/pty/{pty_id}")
+            try:
+                await write_buffer.drain()
+            except websockets.ConnectionClosed:
+                pass
+            finally:
+                # Tear down even if flushing failed or was cancelled, so the
+                # PTY is not left running on the server
+                try:
+                    receive_task.cancel()
+                    await asyncio.gather(receive_task, return_exceptions=True)
+                    await ws.close()
+                finally:
+                    await self._client.delete(f"/sandboxes/{sandbox_id}/pty/{pty_id}")
 
         def on_data(callback: Callable[[bytes], None]) -> None:
             nonlocal data_callback
@@ -93,11 +256,13 @@ class AsyncPtyService:
             id=pty_id,
             cols=cols,
             rows=rows,
-            _write=write,
+            _write=write_buffer.write,
             _resize=resize,
             _kill=kill,
             _on_data=on_data,
             _on_close=on_close,
+            _read=read_buffer.get,
+            _receive_task=receive_task,
         )
 
     async def resize(
@@ -129,9 +294,9 @@ class PtyService:
     This service provides sync wrappers that run async code.
     """
 
-    def __init__(self, client: httpx.Client, api_url: str):
+    def __init__(self, client: httpx.Client, base_url: str):
         self._client = client
-        self._api_url = api_url
+        self._base_url = base_url
 
     def resize(
         self,
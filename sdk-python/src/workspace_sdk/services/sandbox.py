@@ -2,44 +2,313 @@
 Sandbox service for managing sandbox lifecycle
 """
 
-from typing import Optional, List
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, List, Set, Tuple, Union
+from operator import itemgetter
+import asyncio
+import sys
 import httpx
 
+from workspace_sdk.cache import TTLCache
+from workspace_sdk.serialization import JSON_HEADERS, dumps, loads
 from workspace_sdk.types import Sandbox, SandboxState, CreateSandboxParams
 
 
+# Batch endpoint for each operation the scheduler can coalesce
+_BATCH_PATHS = {
+    "create": "/sandboxes/batch",
+    "delete": "/sandboxes/batch/delete",
+}
+
+# Largest batch the server accepts per request
+MAX_BATCH_SIZE = 32
+
+
+# Required sandbox fields, fetched in one C-level call per row
+_sandbox_required = itemgetter(
+    "id", "workspace_id", "template", "state", "created_at", "updated_at"
+)
+
+
+def _sandbox_from_dict(data: dict) -> Sandbox:
+    """Transform API response to Sandbox type"""
+    id, workspace_id, template, state, created_at, updated_at = _sandbox_required(data)
+    get = data.get
+    return Sandbox(
+        id=id,
+        workspace_id=workspace_id,
+        # Low-cardinality values; interning lets large listings share them
+        template=sys.intern(template),
+        state=sys.intern(state),
+        created_at=created_at,
+        updated_at=updated_at,
+        name=get("name"),
+        env=get("env"),
+        metadata=get("metadata"),
+        timeout=get("timeout"),
+        error_message=get("error_message"),
+    )
+
+
+def _create_body(params: CreateSandboxParams) -> dict:
+    """Build the create request body for one sandbox"""
+    data = {
+        "workspace_id": params.workspace_id,
+    }
+    if params.template:
+        data["template"] = params.template
+    if params.name:
+        data["name"] = params.name
+    if params.env:
+        data["env"] = params.env
+    if params.metadata:
+        data["metadata"] = params.metadata
+    if params.timeout:
+        data["timeout"] = params.timeout
+    return data
+
+
+def _create_content(params: CreateSandboxParams) -> bytes:
+    """Build the encoded body for ``POST /sandboxes``"""
+    # Not memoized: a cache would keep env values such as secrets alive
+    return dumps(_create_body(params))
+
+
+class _BatchScheduler:
+    """Coalesces concurrent sandbox creates/deletes into batch requests
+
+    An operation submitted while no request for the same op is in flight is
+    sent right away, so sequential callers never wait. Operations that arrive
+    while one is in flight are collected for up to ``batch_window`` seconds (or
+    until the in-flight request finishes) and sent as one request to the batch
+    endpoint. A batch holding a single operation, or a server without batch
+    endpoints, falls back to the unary endpoints.
+    """
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        unary: Dict[str, Callable[[dict], Awaitable[Any]]],
+        max_batch_size: int,
+        batch_window: float,
+    ):
+        self._client = client
+        self._unary = unary
+        self._max_batch_size = max_batch_size
+        self._batch_window = batch_window
+        self._pending: Dict[str, List[Tuple[dict, asyncio.Future]]] = {}
+        self._timers: Dict[str, asyncio.TimerHandle] = {}
+        self._tasks: Set[asyncio.Task] = set()
+        self._in_flight: Dict[str, int] = {}
+        self._supported = True
+
+    async def submit(self, op: str, item: dict) -> Any:
+        """Queue an operation and wait for its result"""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        pending = self._pending.setdefault(op, [])
+        pending.append((item, future))
+
+        if len(pending) >= self._max_batch_size or not self._in_flight.get(op):
+            # Full batch, or nothing in flight to batch behind
+            self._flush(op)
+        elif len(pending) == 1:
+            self._timers[op] = loop.call_later(self._batch_window, self._flush, op)
+
+        try:
+            return await future
+        except asyncio.CancelledError:
+            # Withdraw the item if it has not been sent yet, so a cancelled
+            # create/delete is never performed on the caller's behalf
+            self._withdraw(op, future)
+            raise
+
+    def _withdraw(self, op: str, future: asyncio.Future) -> None:
+        pending = self._pending.get(op)
+        if not pending:
+            return
+        pending[:] = [entry for entry in pending if entry[1] is not future]
+        if not pending:
+            del self._pending[op]
+            timer = self._timers.pop(op, None)
+            if timer:
+                timer.cancel()
+
+    def _flush(self, op: str) -> None:
+        timer = self._timers.pop(op, None)
+        if timer:
+            timer.cancel()
+        batch = self._pending.pop(op, None)
+        if not batch:
+            return
+
+        task = asyncio.get_running_loop().create_task(self._send(op, batch))
+        self._tasks.add(task)
+        self._in_flight[op] = self._in_flight.get(op, 0) + 1
+        task.add_done_callback(lambda task: self._sent(op, task))
+
+    def _sent(self, op: str, task: asyncio.Task) -> None:
+        self._tasks.discard(task)
+        self._in_flight[op] -= 1
+        if not self._in_flight[op] and self._pending.get(op):
+            # Nothing left to batch behind; send what has collected
+            self._flush(op)
+
+    async def _send(self, op: str, batch: List[Tuple[dict, asyncio.Future]]) -> None:
+        # Callers cancelled between the flush and this task starting
+        batch = [entry for entry in batch if not entry[1].done()]
+        if not batch:
+            return
+        if len(batch) == 1 or not self._supported:
+            await asyncio.gather(*[self._send_unary(op, item, future) for item, future in batch])
+            return
+
+        try:
+            response = await self._client.post(
+                _BATCH_PATHS[op],
+                json={"sandboxes": [item for item, _ in batch]},
+            )
+            if response.status_code in (404, 405):
+                # Server predates the batch endpoints
+                self._supported = False
+                await self._send(op, batch)
+                return
+            response.raise_for_status()
+            results = loads(response.content)["results"]
+            if not isinstance(results, list) or len(results) != len(batch):
+                raise httpx.DecodingError(
+                    f"Batch response does not hold one result per request ({len(batch)})",
+                    request=response.request,
+                )
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), result in zip(batch, results):
+            if future.done():
+                continue
+            try:
+                if result["status"] >= 400:
+                    future.set_exception(_batch_item_error(response.request, result))
+                else:
+                    future.set_result(result.get("sandbox"))
+            except Exception:
+                # Undecodable entry: fail this caller only
+                future.set_exception(
+                    httpx.DecodingError(
+                        f"Malformed batch result: {result!r}", request=response.request
+                    )
+                )
+
+    async def _send_unary(self, op: str, item: dict, future: asyncio.Future) -> None:
+        try:
+            result = await self._unary[op](item)
+        except Exception as e:
+            if not future.done():
+                future.set_exception(e)
+        else:
+            if not future.done():
+                future.set_result(result)
+
+
+def _batch_item_error(request: httpx.Request, result: dict) -> httpx.HTTPStatusError:
+    """Build the error the unary endpoint would have raised for a failed batch item"""
+    status = result["status"]
+    response = httpx.Response(status, json=result.get("error"), request=request)
+    return httpx.HTTPStatusError(
+        f"Batched sandbox request failed with status {status}",
+        request=request,
+        response=response,
+    )
+
+
 class AsyncSandboxService:
     """Async service for managing sandboxes"""
 
-    def __init__(self, client: httpx.AsyncClient, api_url: str):
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        base_url: str,
+        max_batch_size: int = 32,
+        batch_window_ms: float = 5,
+    ):
+        """
+        Args:
+            client: HTTP client bound to the API base URL
+            base_url: Base URL of the workspace API, including the ``/api/v1`` prefix
+            max_batch_size: Maximum creates/deletes coalesced into one batch
+                request, capped at the server's ``MAX_BATCH_SIZE``; 1 disables
+                batching (default: 32)
+            batch_window_ms: How long operations issued while another one is in
+                flight wait for more before being sent as a batch, in
+                milliseconds (default: 5)
+        """
         self._client = client
-        self._api_url = api_url
+        self._base_url = base_url
+        self._cache = TTLCache()
+        self._batcher: Optional[_BatchScheduler] = None
+        if max_batch_size > 1:
+            self._batcher = _BatchScheduler(
+                client,
+                {"create": self._create, "delete": self._delete},
+                min(max_batch_size, MAX_BATCH_SIZE),
+                batch_window_ms / 1000,
+            )
 
     async def create(self, params: CreateSandboxParams) -> Sandbox:
         """Create a new sandbox bound to a workspace"""
-        data = {
-            "workspace_id": params.workspace_id,
-        }
-        if params.template:
-            data["template"] = params.template
-        if params.name:
-            data["name"] = params.name
-        if params.env:
-            data["env"] = params.env
-        if params.metadata:
-            data["metadata"] = params.metadata
-        if params.timeout:
-            data["timeout"] = params.timeout
-
-        response = await self._client.post("/sandboxes", json=data)
-        response.raise_for_status()
-        return self._transform_sandbox(response.json())
+        if self._batcher:
+            result = await self._batcher.submit("create", _create_body(params))
+        else:
+            result = await self._post_create(_create_content(params))
+        sandbox = self._transform_sandbox(result)
+        self._cache.put(sandbox.id, sandbox)
+        return sandbox
 
-    async def get(self, sandbox_id: str) -> Sandbox:
-        """Get a sandbox by ID"""
+    async def create_many(
+        self,
+        params_list: Iterable[CreateSandboxParams],
+        return_exceptions: bool = False,
+    ) -> List[Union[Sandbox, BaseException]]:
+        """
+        Create several sandboxes, returning them in the order given.
+
+        The creates go through the batch scheduler and are sent as batch
+        requests of up to ``max_batch_size``. With batching disabled they
+        run as concurrent unary requests, bounded by the client's
+        ``max_concurrency``.
+
+        Args:
+            params_list: Parameters for each sandbox
+            return_exceptions: Return failures in place of their sandbox
+                instead of raising the first one; sandboxes that were created
+                are never discarded this way (default: False)
+        """
+        return await asyncio.gather(
+            *[self.create(params) for params in params_list],
+            return_exceptions=return_exceptions,
+        )
+
+    async def get(self, sandbox_id: str, cache_ttl: float = 0) -> Sandbox:
+        """
+        Get a sandbox by ID.
+
+        Args:
+            sandbox_id: Sandbox ID
+            cache_ttl: Return a sandbox fetched or created by this service
+                within the last ``cache_ttl`` seconds without a request
+                (default: 0, always fetch). Sandbox state changes over time,
+                so keep this short.
+        """
+        cached = self._cache.get(sandbox_id, cache_ttl)
+        if cached is not None:
+            return cached
         response = await self._client.get(f"/sandboxes/{sandbox_id}")
         response.raise_for_status()
-        return self._transform_sandbox(response.json())
+        sandbox = self._transform_sandbox(loads(response.content))
+        self._cache.put(sandbox_id, sandbox)
+        return sandbox
 
     async def list(self, state: Optional[SandboxState] = None) -> List[Sandbox]:
         """List all sandboxes"""
@@ -49,67 +318,166 @@ class AsyncSandboxService:
 
         response = await self._client.get("/sandboxes", params=params)
         response.raise_for_status()
-        data = response.json()
+        data = loads(response.content)
         return [self._transform_sandbox(s) for s in data.get("sandboxes", [])]
 
     async def delete(self, sandbox_id: str, force: bool = False) -> None:
         """Delete a sandbox"""
+        self._cache.invalidate(sandbox_id)
+        item = {"id": sandbox_id, "force": force}
+        if self._batcher:
+            await self._batcher.submit("delete", item)
+        else:
+            await self._delete(item)
+
+    async def _create(self, data: dict) -> dict:
+        """Create a sandbox through the unary endpoint"""
+        return await self._post_create(dumps(data))
+
+    async def _post_create(self, content: bytes) -> dict:
+        """Create a sandbox through the unary endpoint from an encoded body"""
+        response = await self._client.post("/sandboxes", content=content, headers=JSON_HEADERS)
+        response.raise_for_status()
+        return loads(response.content)
+
+    async def _delete(self, item: dict) -> None:
+        """Delete a sandbox through the unary endpoint"""
         params = {}
-        if force:
+        if item["force"]:
             params["force"] = "true"
 
-        response = await self._client.delete(f"/sandboxes/{sandbox_id}", params=params)
+        response = await self._client.delete(f"/sandboxes/{item['id']}", params=params)
         response.raise_for_status()
 
-    def _transform_sandbox(self, data: dict) -> Sandbox:
-        """Transform API response to Sandbox type"""
-        return Sandbox(
-            id=data["id"],
-            workspace_id=data["workspace_id"],
-            name=data.get("name"),
-            template=data["template"],
-            state=data["state"],
-            env=data.get("env"),
-            metadata=data.get("metadata"),
-            created_at=data["created_at"],
-            updated_at=data["updated_at"],
-            timeout=data.get("timeout"),
-            error_message=data.get("error_message"),
-        )
+    _transform_sandbox = staticmethod(_sandbox_from_dict)
 
 
 class SandboxService:
     """Sync service for managing sandboxes (wrapper around async service)"""
 
-    def __init__(self, client: httpx.Client, api_url: str):
+    def __init__(self, client: httpx.Client, base_url: str):
         self._client = client
-        self._api_url = api_url
+        self._base_url = base_url
+        self._cache = TTLCache()
+        self._batch_supported = True
 
     def create(self, params: CreateSandboxParams) -> Sandbox:
         """Create a new sandbox bound to a workspace"""
-        data = {
-            "workspace_id": params.workspace_id,
-        }
-        if params.template:
-            data["template"] = params.template
-        if params.name:
-            data["name"] = params.name
-        if params.env:
-            data["env"] = params.env
-        if params.metadata:
-            data["metadata"] = params.metadata
-        if params.timeout:
-            data["timeout"] = params.timeout
-
-        response = self._client.post("/sandboxes", json=data)
+        return self._create(_create_content(params))
+
+    def _create(self, content: bytes) -> Sandbox:
+        """Create a sandbox through the unary endpoint from an encoded body"""
+        response = self._client.post("/sandboxes", content=content, headers=JSON_HEADERS)
         response.raise_for_status()
-        return self._transform_sandbox(response.json())
+        sandbox = self._transform_sandbox(loads(response.content))
+        self._cache.put(sandbox.id, sandbox)
+        return sandbox
+
+    def create_many(
+        self,
+        params_list: Iterable[CreateSandboxParams],
+        return_exceptions: bool = False,
+    ) -> List[Union[Sandbox, BaseException]]:
+        """
+        Create several sandboxes in batch requests, returning them in order.
+
+        Sandboxes are sent ``MAX_BATCH_SIZE`` per request. Servers without the
+        batch endpoint get one request per sandbox.
+
+        Args:
+            params_list: Parameters for each sandbox
+            return_exceptions: Return failures in place of their sandbox
+                instead of raising the first one; sandboxes that were created
+                are never discarded this way (default: False)
+        """
+        items = [_create_body(params) for params in params_list]
+        if not items:
+            return []
+
+        results: List[Union[Sandbox, BaseException]] = []
+        for start in range(0, len(items), MAX_BATCH_SIZE):
+            chunk = items[start:start + MAX_BATCH_SIZE]
+            if self._batch_supported:
+                try:
+                    response = self._client.post(
+                        _BATCH_PATHS["create"], json={"sandboxes": chunk}
+                    )
+                    if response.status_code not in (404, 405):
+                        results.extend(
+                            self._batch_results(response, len(chunk), return_exceptions)
+                        )
+                        continue
+                except Exception as e:
+                    # The whole batch failed; keep the sandboxes already created
+                    if not return_exceptions:
+                        raise
+                    results.extend([e] * len(chunk))
+                    continue
+                # Server predates the batch endpoints
+                self._batch_supported = False
 
-    def get(self, sandbox_id: str) -> Sandbox:
-        """Get a sandbox by ID"""
+            for item in chunk:
+                try:
+                    results.append(self._create(dumps(item)))
+                except Exception as e:
+                    if not return_exceptions:
+                        raise
+                    results.append(e)
+        return results
+
+    def _batch_results(
+        self,
+        response: httpx.Response,
+        count: int,
+        return_exceptions: bool,
+    ) -> List[Union[Sandbox, BaseException]]:
+        """Unpack a batch create response into sandboxes and per-item errors"""
+        response.raise_for_status()
+        results = loads(response.content)["results"]
+        if not isinstance(results, list) or len(results) != count:
+            raise httpx.DecodingError(
+                f"Batch response does not hold one result per request ({count})",
+                request=response.request,
+            )
+
+        sandboxes: List[Union[Sandbox, BaseException]] = []
+        for result in results:
+            try:
+                if result["status"] < 400:
+                    sandbox = self._transform_sandbox(result["sandbox"])
+                    self._cache.put(sandbox.id, sandbox)
+                    sandboxes.append(sandbox)
+                    continue
+                error: BaseException = _batch_item_error(response.request, result)
+            except Exception:
+                # Undecodable entry: fail this sandbox only
+                error = httpx.DecodingError(
+                    f"Malformed batch result: {result!r}", request=response.request
+                )
+            if not return_exceptions:
+                raise error
+            sandboxes.append(error)
+        return sandboxes
+
+    def get(self, sandbox_id: str, cache_ttl: float = 0) -> Sandbox:
+        """
+        Get a sandbox by ID.
+
+        Args:
+            sandbox_id: Sandbox ID
+            cache_ttl: Return a sandbox fetched or created by this service
+                within the last ``cache_ttl`` seconds without a request
+                (default: 0, always fetch). Sandbox state changes over time,
+                so keep this short.
+        """
+        cached = self._cache.get(sandbox_id, cache_ttl)
+        if cached is not None:
+            return cached
         response = self._client.get(f"/sandboxes/{sandbox_id}")
         response.raise_for_status()
-        return self._transform_sandbox(response.json())
+        sandbox = self._transform_sandbox(loads(response.content))
+        self._cache.put(sandbox_id, sandbox)
+        return sandbox
 
     def list(self, state: Optional[SandboxState] = None) -> List[Sandbox]:
         """List all sandboxes"""
@@ -119,11 +487,12 @@ class SandboxService:
 
         response = self._client.get("/sandboxes", params=params)
         response.raise_for_status()
-        data = response.json()
+        data = loads(response.content)
         return [self._transform_sandbox(s) for s in data.get("sandboxes", [])]
 
     def delete(self, sandbox_id: str, force: bool = False) -> None:
         """Delete a sandbox"""
+        self._cache.invalidate(sandbox_id)
         params = {}
         if force:
             params["force"] = "true"
@@ -131,18 +500,4 @@ class SandboxService:
         response = self._client.delete(f"/sandboxes/{sandbox_id}", params=params)
         response.raise_for_status()
 
-    def _transform_sandbox(self, data: dict) -> Sandbox:
-        """Transform API response to Sandbox type"""
-        return Sandbox(
-            id=data["id"],
-            workspace_id=data["workspace_id"],
-            name=data.get("name"),
-            template=data["template"],
-            state=data["state"],
-            env=data.get("env"),
-            metadata=data.get("metadata"),
-            created_at=data["created_at"],
-            updated_at=data["updated_at"],
-            timeout=data.get("timeout"),
-            error_message=data.get("error_message"),
-        )
+    _transform_sandbox = staticmethod(_sandbox_from_dict)
@@ -2,49 +2,161 @@
 Workspace service for managing workspaces and file operations
 """
 
-from typing import Optional, List
+from typing import Any, AsyncIterator, Iterable, Iterator, Optional, List, Tuple
+from functools import lru_cache
+from operator import itemgetter
+import asyncio
+import os
 import httpx
 
+from workspace_sdk.cache import TTLCache
+from workspace_sdk.eventloop import taskgroup_gather
+from workspace_sdk.serialization import JSON_HEADERS, dumps, loads
 from workspace_sdk.types import Workspace, CreateWorkspaceParams, FileInfo
 
 
+# Chunk size for streamed file downloads
+READ_CHUNK_SIZE = 64 * 1024
+
+OCTET_STREAM_HEADERS = {"Content-Type": "application/octet-stream"}
+
+# Concurrent get_file_info calls issued by list_files_detailed
+LIST_DETAILED_CONCURRENCY = 32
+
+# Requests in flight at once for copy_many / delete_many / mkdir_many
+BULK_CONCURRENCY = 32
+
+# Batch endpoints for per-path file operations
+_BATCH_INFO_PATH = "/workspaces/{}/files/batch/info"
+_BATCH_READ_PATH = "/workspaces/{}/files/batch/read"
+
+# Required fields, fetched in one C-level call per row
+_workspace_required = itemgetter("id", "created_at", "updated_at")
+_file_info_required = itemgetter("name", "path", "type", "size")
+
+
+@lru_cache(maxsize=256)
+def _encode_create_body(name: Optional[str], metadata: Tuple[Tuple[str, str], ...]) -> bytes:
+    """Encode a create body; identical params reuse the cached bytes"""
+    data = {}
+    if name:
+        data["name"] = name
+    if metadata:
+        data["metadata"] = dict(metadata)
+    return dumps(data)
+
+
+def _create_content(params: Optional[CreateWorkspaceParams]) -> bytes:
+    """Build the encoded body for ``POST /workspaces``"""
+    if params is None:
+        return _encode_create_body(None, ())
+    return _encode_create_body(
+        params.name,
+        tuple(params.metadata.items()) if params.metadata else (),
+    )
+
+
+def _workspace_from_dict(data: dict) -> Workspace:
+    """Transform API response to Workspace type"""
+    id, created_at, updated_at = _workspace_required(data)
+    get = data.get
+    return Workspace(
+        id=id,
+        created_at=created_at,
+        updated_at=updated_at,
+        name=get("name"),
+        nfs_url=get("nfs_url"),
+        metadata=get("metadata"),
+    )
+
+
+def _file_info_from_dict(data: dict) -> FileInfo:
+    """Transform API response to FileInfo type"""
+    return FileInfo(*_file_info_required(data), data.get("modified_at"))
+
+
+def _file_infos_from_list(files: List[dict]) -> List[FileInfo]:
+    """Transform a directory listing; one positional FileInfo call per entry"""
+    make = FileInfo
+    return [
+        make(f["name"], f["path"], f["type"], f["size"], f.get("modified_at"))
+        for f in files
+    ]
+
+
+def _batch_values(response: httpx.Response, key: str) -> List[Any]:
+    """Unpack a file batch response, raising the first per-path failure"""
+    response.raise_for_status()
+    values = []
+    for result in loads(response.content)["results"]:
+        status = result["status"]
+        if status >= 400:
+            raise httpx.HTTPStatusError(
+                f"Batched file request for {result['path']} failed with status {status}",
+                request=response.request,
+                response=httpx.Response(status, json=result.get("error"), request=response.request),
+            )
+        values.append(result[key])
+    return values
+
+
+def _check_fits(response: httpx.Response, capacity: int, path: str) -> None:
+    """Fail before reading a body that Content-Length says will not fit"""
+    length = response.headers.get("Content-Length")
+    if length is not None and int(length) > capacity:
+        raise ValueError(f"{path} is {length} bytes, larger than the {capacity}-byte buffer")
+
+
 class AsyncWorkspaceService:
     """Async service for managing workspaces and file operations"""
 
-    def __init__(self, client: httpx.AsyncClient, api_url: str):
+    def __init__(self, client: httpx.AsyncClient, base_url: str):
         self._client = client
-        self._api_url = api_url
+        self._base_url = base_url
+        self._cache = TTLCache()
+        self._batch_supported = True
 
     # ==================== Workspace CRUD ====================
 
     async def create(self, params: Optional[CreateWorkspaceParams] = None) -> Workspace:
         """Create a new workspace"""
-        data = {}
-        if params:
-            if params.name:
-                data["name"] = params.name
-            if params.metadata:
-                data["metadata"] = params.metadata
-
-        response = await self._client.post("/workspaces", json=data)
+        response = await self._client.post(
+            "/workspaces", content=_create_content(params), headers=JSON_HEADERS
+        )
         response.raise_for_status()
-        return self._transform_workspace(response.json())
-
-    async def get(self, workspace_id: str) -> Workspace:
-        """Get a workspace by ID"""
+        workspace = self._transform_workspace(loads(response.content))
+        self._cache.put(workspace.id, workspace)
+        return workspace
+
+    async def get(self, workspace_id: str, cache_ttl: float = 0) -> Workspace:
+        """
+        Get a workspace by ID.
+
+        Args:
+            workspace_id: Workspace ID
+            cache_ttl: Return a workspace fetched or created by this service
+                within the last ``cache_ttl`` seconds without a request
+                (default: 0, always fetch)
+        """
+        cached = self._cache.get(workspace_id, cache_ttl)
+        if cached is not None:
+            return cached
         response = await self._client.get(f"/workspaces/{workspace_id}")
         response.raise_for_status()
-        return self._transform_workspace(response.json())
+        workspace = self._transform_workspace(loads(response.content))
+        self._cache.put(workspace_id, workspace)
+        return workspace
 
     async def list(self) -> List[Workspace]:
         """List all workspaces"""
         response = await self._client.get("/workspaces")
         response.raise_for_status()
-        data = response.json()
+        data = loads(response.content)
         return [self._transform_workspace(w) for w in data.get("workspaces", [])]
 
     async def delete(self, workspace_id: str) -> None:
         """Delete a workspace"""
+        self._cache.invalidate(workspace_id)
         response = await self._client.delete(f"/workspaces/{workspace_id}")
         response.raise_for_status()
 
@@ -57,25 +169,93 @@ class AsyncWorkspaceService:
             params={"path": path}
         )
         response.raise_for_status()
-        return response.json()["content"]
+        return loads(response.content)["content"]
 
     async def read_file_bytes(self, workspace_id: str, path: str) -> bytes:
         """Read a file as bytes from workspace"""
-        response = await self._client.get(
-            f"/workspaces/{workspace_id}/files",
+        return b"".join([chunk async for chunk in self.read_file_stream(workspace_id, path)])
+
+    async def read_file_into(
+        self,
+        workspace_id: str,
+        path: str,
+        buffer: bytearray | memoryview,
+    ) -> int:
+        """
+        Read a file from workspace into a caller-supplied writable buffer.
+
+        The body is copied chunk by chunk as it arrives, so a buffer can be
+        reused across reads without allocating a new ``bytes`` per file.
+
+        Returns:
+            Number of bytes read into the start of ``buffer``
+
+        Raises:
+            ValueError: If the file is larger than ``buffer``
+        """
+        view = memoryview(buffer).cast("B")
+        offset = 0
+        async with self._client.stream(
+            "GET",
+            f"/workspaces/{workspace_id}/files/raw",
             params={"path": path},
-        )
-        response.raise_for_status()
-        return response.content
+        ) as response:
+            response.raise_for_status()
+            _check_fits(response, len(view), path)
+            async for chunk in response.aiter_bytes(READ_CHUNK_SIZE):
+                end = offset + len(chunk)
+                if end > len(view):
+                    raise ValueError(f"{path} does not fit in a {len(view)}-byte buffer")
+                view[offset:end] = chunk
+                offset = end
+        return offset
+
+    async def read_file_stream(
+        self,
+        workspace_id: str,
+        path: str,
+        chunk_size: int = READ_CHUNK_SIZE,
+    ) -> AsyncIterator[bytes]:
+        """Stream a file's raw bytes from workspace without buffering it whole"""
+        async with self._client.stream(
+            "GET",
+            f"/workspaces/{workspace_id}/files/raw",
+            params={"path": path},
+        ) as response:
+            response.raise_for_status()
+            async for chunk in response.aiter_bytes(chunk_size):
+                yield chunk
+
+    async def read_file_to(
+        self,
+        workspace_id: str,
+        path: str,
+        local_path: str | os.PathLike,
+    ) -> int:
+        """
+        Download a file from workspace to a local path.
+
+        Disk writes run in a worker thread so the event loop is not blocked.
+
+        Returns:
+            Number of bytes written
+        """
+        written = 0
+        with open(local_path, "wb") as f:
+            async for chunk in self.read_file_stream(workspace_id, path):
+                written += await asyncio.to_thread(f.write, chunk)
+        return written
 
     async def write_file(self, workspace_id: str, path: str, content: str | bytes) -> None:
-        """Write a file to workspace"""
-        if isinstance(content, bytes):
-            content = content.decode('utf-8')
+        """Write a file to workspace; str content is stored UTF-8 encoded"""
+        if isinstance(content, str):
+            content = content.encode("utf-8")
+        # Raw upload: no JSON escaping, and binary content round-trips
         response = await self._client.put(
-            f"/workspaces/{workspace_id}/files",
+            f"/workspaces/{workspace_id}/files/raw",
             params={"path": path},
-            json={"content": content}
+            content=content,
+            headers=OCTET_STREAM_HEADERS,
         )
         response.raise_for_status()
 
@@ -94,8 +274,44 @@ class AsyncWorkspaceService:
             params={"path": path}
         )
         response.raise_for_status()
-        data = response.json()
-        return [self._transform_file_info(f) for f in data.get("files", [])]
+        data = loads(response.content)
+        return _file_infos_from_list(data.get("files", []))
+
+    async def list_files_detailed(
+        self,
+        workspace_id: str,
+        path: str,
+        max_concurrency: int = LIST_DETAILED_CONCURRENCY,
+    ) -> List[FileInfo]:
+        """
+        List directory contents with a full ``get_file_info`` for every entry.
+
+        The lookups are sent as one ``stat_many`` batch request; on servers
+        without the batch endpoint they run concurrently, at most
+        ``max_concurrency`` at a time.
+        """
+        files = await self.list_files(workspace_id, path)
+        return await self.stat_many(workspace_id, [f.path for f in files], max_concurrency)
+
+    async def walk(self, workspace_id: str, root: str) -> List[FileInfo]:
+        """
+        List every entry under ``root`` recursively.
+
+        Directories at the same depth are listed concurrently, so the walk
+        costs one round trip per level rather than one per directory.
+        """
+        entries: List[FileInfo] = []
+        level = [root]
+        while level:
+            listings = await taskgroup_gather(
+                (self.list_files(workspace_id, path) for path in level),
+                max_concurrency=LIST_DETAILED_CONCURRENCY,
+            )
+            level = []
+            for files in listings:
+                entries.extend(files)
+                level.extend(f.path for f in files if f.type == "directory")
+        return entries
 
     async def delete_file(self, workspace_id: str, path: str, recursive: bool = False) -> None:
         """Delete a file or directory in workspace"""
@@ -121,6 +337,61 @@ class AsyncWorkspaceService:
         )
         response.raise_for_status()
 
+    async def mkdir_many(
+        self,
+        workspace_id: str,
+        paths: Iterable[str],
+        max_concurrency: int = BULK_CONCURRENCY,
+    ) -> None:
+        """
+        Create several directories concurrently over the client's connection pool.
+
+        Runs in an ``asyncio.TaskGroup`` via ``taskgroup_gather``: the first
+        failure cancels the remaining requests and is raised as is, not as an
+        ``ExceptionGroup``.
+        """
+        await taskgroup_gather(
+            (self.mkdir(workspace_id, path) for path in paths),
+            max_concurrency=max_concurrency,
+        )
+
+    async def delete_many(
+        self,
+        workspace_id: str,
+        paths: Iterable[str],
+        recursive: bool = False,
+        max_concurrency: int = BULK_CONCURRENCY,
+    ) -> None:
+        """
+        Delete several files or directories concurrently.
+
+        Runs in an ``asyncio.TaskGroup`` via ``taskgroup_gather``: the first
+        failure cancels the remaining requests and is raised as is, not as an
+        ``ExceptionGroup``.
+        """
+        await taskgroup_gather(
+            (self.delete_file(workspace_id, path, recursive) for path in paths),
+            max_concurrency=max_concurrency,
+        )
+
+    async def copy_many(
+        self,
+        workspace_id: str,
+        pairs: Iterable[Tuple[str, str]],
+        max_concurrency: int = BULK_CONCURRENCY,
+    ) -> None:
+        """
+        Copy several ``(source, destination)`` pairs concurrently.
+
+        Runs in an ``asyncio.TaskGroup`` via ``taskgroup_gather``: the first
+        failure cancels the remaining requests and is raised as is, not as an
+        ``ExceptionGroup``.
+        """
+        await taskgroup_gather(
+            (self.copy_file(workspace_id, source, destination) for source, destination in pairs),
+            max_concurrency=max_concurrency,
+        )
+
     async def get_file_info(self, workspace_id: str, path: str) -> FileInfo:
         """Get file information in workspace"""
         response = await self._client.get(
@@ -128,77 +399,140 @@ class AsyncWorkspaceService:
             params={"path": path}
         )
         response.raise_for_status()
-        return self._transform_file_info(response.json())
+        return self._transform_file_info(loads(response.content))
 
     async def exists(self, workspace_id: str, path: str) -> bool:
         """Check if a file or directory exists in workspace"""
-        try:
-            await self.get_file_info(workspace_id, path)
-            return True
-        except Exception:
+        url = f"/workspaces/{workspace_id}/files/info"
+        params = {"path": path}
+        # HEAD skips the JSON stat payload; fall back to GET on servers
+        # that do not route it
+        response = await self._client.head(url, params=params)
+        if response.status_code == 405:
+            response = await self._client.get(url, params=params)
+        if response.status_code == 404:
             return False
-
-    # ==================== Transform Helpers ====================
-
-    def _transform_workspace(self, data: dict) -> Workspace:
-        """Transform API response to Workspace type"""
-        return Workspace(
-            id=data["id"],
-            name=data.get("name"),
-            nfs_url=data.get("nfs_url"),
-            metadata=data.get("metadata"),
-            created_at=data["created_at"],
-            updated_at=data["updated_at"],
+        response.raise_for_status()
+        return True
+
+    async def stat_many(
+        self,
+        workspace_id: str,
+        paths: Iterable[str],
+        max_concurrency: int = LIST_DETAILED_CONCURRENCY,
+    ) -> List[FileInfo]:
+        """
+        Get file information for several paths in one request, in order.
+
+        Servers without the batch endpoint get concurrent ``get_file_info``
+        calls, at most ``max_concurrency`` at a time.
+
+        Raises:
+            httpx.HTTPStatusError: For the first path that could not be looked up
+        """
+        paths = list(paths)
+        if not paths:
+            return []
+        if self._batch_supported:
+            response = await self._client.post(
+                _BATCH_INFO_PATH.format(workspace_id), json={"paths": paths}
+            )
+            if response.status_code not in (404, 405):
+                return [self._transform_file_info(info) for info in _batch_values(response, "info")]
+            # Server predates the batch endpoints
+            self._batch_supported = False
+        return await taskgroup_gather(
+            (self.get_file_info(workspace_id, path) for path in paths),
+            max_concurrency=max_concurrency,
         )
 
-    def _transform_file_info(self, data: dict) -> FileInfo:
-        """Transform API response to FileInfo type"""
-        return FileInfo(
-            name=data["name"],
-            path=data["path"],
-            type=data["type"],
-            size=data["size"],
-            modified_at=data.get("modified_at"),
+    async def read_many(
+        self,
+        workspace_id: str,
+        paths: Iterable[str],
+        max_concurrency: int = LIST_DETAILED_CONCURRENCY,
+    ) -> List[str]:
+        """
+        Read several text files in one request, returning contents in order.
+
+        Servers without the batch endpoint get concurrent ``read_file``
+        calls, at most ``max_concurrency`` at a time.
+
+        Raises:
+            httpx.HTTPStatusError: For the first path that could not be read
+        """
+        paths = list(paths)
+        if not paths:
+            return []
+        if self._batch_supported:
+            response = await self._client.post(
+                _BATCH_READ_PATH.format(workspace_id), json={"paths": paths}
+            )
+            if response.status_code not in (404, 405):
+                return _batch_values(response, "content")
+            # Server predates the batch endpoints
+            self._batch_supported = False
+        return await taskgroup_gather(
+            (self.read_file(workspace_id, path) for path in paths),
+            max_concurrency=max_concurrency,
         )
 
+    # ==================== Transform Helpers ====================
+
+    _transform_workspace = staticmethod(_workspace_from_dict)
+    _transform_file_info = staticmethod(_file_info_from_dict)
+
 
 class WorkspaceService:
     """Sync service for managing workspaces and file operations"""
 
-    def __init__(self, client: httpx.Client, api_url: str):
+    def __init__(self, client: httpx.Client, base_url: str):
         self._client = client
-        self._api_url = api_url
+        self._base_url = base_url
+        self._cache = TTLCache()
+        self._batch_supported = True
 
     # ==================== Workspace CRUD ====================
 
     def create(self, params: Optional[CreateWorkspaceParams] = None) -> Workspace:
         """Create a new workspace"""
-        data = {}
-        if params:
-            if params.name:
-                data["name"] = params.name
-            if params.metadata:
-                data["metadata"] = params.metadata
-
-        response = self._client.post("/workspaces", json=data)
+        response = self._client.post(
+            "/workspaces", content=_create_content(params), headers=JSON_HEADERS
+        )
         response.raise_for_status()
-        return self._transform_workspace(response.json())
-
-    def get(self, workspace_id: str) -> Workspace:
-        """Get a workspace by ID"""
+        workspace = self._transform_workspace(loads(response.content))
+        self._cache.put(workspace.id, workspace)
+        return workspace
+
+    def get(self, workspace_id: str, cache_ttl: float = 0) -> Workspace:
+        """
+        Get a workspace by ID.
+
+        Args:
+            workspace_id: Workspace ID
+            cache_ttl: Return a workspace fetched or created by this service
+                within the last ``cache_ttl`` seconds without a request
+                (default: 0, always fetch)
+        """
+        cached = self._cache.get(workspace_id, cache_ttl)
+        if cached is not None:
+            return cached
         response = self._client.get(f"/workspaces/{workspace_id}")
         response.raise_for_status()
-        return self._transform_workspace(response.json())
+        workspace = self._transform_workspace(loads(response.content))
+        self._cache.put(workspace_id, workspace)
+        return workspace
 
     def list(self) -> List[Workspace]:
         """List all workspaces"""
         response = self._client.get("/workspaces")
         response.raise_for_status()
-        data = response.json()
+        data = loads(response.content)
         return [self._transform_workspace(w) for w in data.get("workspaces", [])]
 
     def delete(self, workspace_id: str) -> None:
         """Delete a workspace"""
+        self._cache.invalidate(workspace_id)
         response = self._client.delete(f"/workspaces/{workspace_id}")
         response.raise_for_status()
 
@@ -211,25 +545,90 @@ class WorkspaceService:
             params={"path": path}
         )
         response.raise_for_status()
-        return response.json()["content"]
+        return loads(response.content)["content"]
 
     def read_file_bytes(self, workspace_id: str, path: str) -> bytes:
         """Read a file as bytes from workspace"""
-        response = self._client.get(
-            f"/workspaces/{workspace_id}/files",
+        return b"".join(self.read_file_stream(workspace_id, path))
+
+    def read_file_into(
+        self,
+        workspace_id: str,
+        path: str,
+        buffer: bytearray | memoryview,
+    ) -> int:
+        """
+        Read a file from workspace into a caller-supplied writable buffer.
+
+        The body is copied chunk by chunk as it arrives, so a buffer can be
+        reused across reads without allocating a new ``bytes`` per file.
+
+        Returns:
+            Number of bytes read into the start of ``buffer``
+
+        Raises:
+            ValueError: If the file is larger than ``buffer``
+        """
+        view = memoryview(buffer).cast("B")
+        offset = 0
+        with self._client.stream(
+            "GET",
+            f"/workspaces/{workspace_id}/files/raw",
             params={"path": path},
-        )
-        response.raise_for_status()
-        return response.content
+        ) as response:
+            response.raise_for_status()
+            _check_fits(response, len(view), path)
+            for chunk in response.iter_bytes(READ_CHUNK_SIZE):
+                end = offset + len(chunk)
+                if end > len(view):
+                    raise ValueError(f"{path} does not fit in a {len(view)}-byte buffer")
+                view[offset:end] = chunk
+                offset = end
+        return offset
+
+    def read_file_stream(
+        self,
+        workspace_id: str,
+        path: str,
+        chunk_size: int = READ_CHUNK_SIZE,
+    ) -> Iterator[bytes]:
+        """Stream a file's raw bytes from workspace without buffering it whole"""
+        with self._client.stream(
+            "GET",
+            f"/workspaces/{workspace_id}/files/raw",
+            params={"path": path},
+        ) as response:
+            response.raise_for_status()
+            yield from response.iter_bytes(chunk_size)
+
+    def read_file_to(
+        self,
+        workspace_id: str,
+        path: str,
+        local_path: str | os.PathLike,
+    ) -> int:
+        """
+        Download a file from workspace to a local path.
+
+        Returns:
+            Number of bytes written
+        """
+        written = 0
+        with open(local_path, "wb") as f:
+            for chunk in self.read_file_stream(workspace_id, path):
+                written += f.write(chunk)
+        return written
 
     def write_file(self, workspace_id: str, path: str, content: str | bytes) -> None:
-        """Write a file to workspace"""
-        if isinstance(content, bytes):
-            content = content.decode('utf-8')
+        """Write a file to workspace; str content is stored UTF-8 encoded"""
+        if isinstance(content, str):
+            content = content.encode("utf-8")
+        # Raw upload: no JSON escaping, and binary content round-trips
         response = self._client.put(
-            f"/workspaces/{workspace_id}/files",
+            f"/workspaces/{workspace_id}/files/raw",
             params={"path": path},
-            json={"content": content}
+            content=content,
+            headers=OCTET_STREAM_HEADERS,
         )
         response.raise_for_status()
 
@@ -248,8 +647,18 @@ class WorkspaceService:
             params={"path": path}
         )
         response.raise_for_status()
-        data = response.json()
-        return [self._transform_file_info(f) for f in data.get("files", [])]
+        data = loads(response.content)
+        return _file_infos_from_list(data.get("files", []))
+
+    def walk(self, workspace_id: str, root: str) -> List[FileInfo]:
+        """List every entry under ``root`` recursively"""
+        entries: List[FileInfo] = []
+        pending = [root]
+        while pending:
+            files = self.list_files(workspace_id, pending.pop())
+            entries.extend(files)
+            pending.extend(f.path for f in files if f.type == "directory")
+        return entries
 
     def delete_file(self, workspace_id: str, path: str, recursive: bool = False) -> None:
         """Delete a file or directory in workspace"""
@@ -282,35 +691,67 @@ class WorkspaceService:
             params={"path": path}
         )
         response.raise_for_status()
-        return self._transform_file_info(response.json())
+        return self._transform_file_info(loads(response.content))
 
     def exists(self, workspace_id: str, path: str) -> bool:
         """Check if a file or directory exists in workspace"""
-        try:
-            self.get_file_info(workspace_id, path)
-            return True
-        except Exception:
+        url = f"/workspaces/{workspace_id}/files/info"
+        params = {"path": path}
+        # HEAD skips the JSON stat payload; fall back to GET on servers
+        # that do not route it
+        response = self._client.head(url, params=params)
+        if response.status_code == 405:
+            response = self._client.get(url, params=params)
+        if response.status_code == 404:
             return False
+        response.raise_for_status()
+        return True
+
+    def stat_many(self, workspace_id: str, paths: Iterable[str]) -> List[FileInfo]:
+        """
+        Get file information for several paths in one request, in order.
+
+        Servers without the batch endpoint get one ``get_file_info`` call per path.
+
+        Raises:
+            httpx.HTTPStatusError: For the first path that could not be looked up
+        """
+        paths = list(paths)
+        if not paths:
+            return []
+        if self._batch_supported:
+            response = self._client.post(
+                _BATCH_INFO_PATH.format(workspace_id), json={"paths": paths}
+            )
+            if response.status_code not in (404, 405):
+                return [self._transform_file_info(info) for info in _batch_values(response, "info")]
+            # Server predates the batch endpoints
+            self._batch_supported = False
+        return [self.get_file_info(workspace_id, path) for path in paths]
+
+    def read_many(self, workspace_id: str, paths: Iterable[str]) -> List[str]:
+        """
+        Read several text files in one request, returning contents in order.
+
+        Servers without the batch endpoint get one ``read_file`` call per path.
+
+        Raises:
+            httpx.HTTPStatusError: For the first path that could not be read
+        """
+        paths = list(paths)
+        if not paths:
+            return []
+        if self._batch_supported:
+            response = self._client.post(
+                _BATCH_READ_PATH.format(workspace_id), json={"paths": paths}
+            )
+            if response.status_code not in (404, 405):
+                return _batch_values(response, "content")
+            # Server predates the batch endpoints
+            self._batch_supported = False
+        return [self.read_file(workspace_id, path) for path in paths]
 
     # ==================== Transform Helpers ====================
 
-    def _transform_workspace(self, data: dict) -> Workspace:
-        """Transform API response to Workspace type"""
-        return Workspace(
-            id=data["id"],
-            name=data.get("name"),
-            nfs_url=data.get("nfs_url"),
-            metadata=data.get("metadata"),
-            created_at=data["created_at"],
-            updated_at=data["updated_at"],
-        )
-
-    def _transform_file_info(self, data: dict) -> FileInfo:
-        """Transform API response to FileInfo type"""
-        return FileInfo(
-            name=data["name"],
-            path=data["path"],
-            type=data["type"],
-            size=data["size"],
-            modified_at=data.get("modified_at"),
-        )
+    _transform_workspace = staticmethod(_workspace_from_dict)
+    _transform_file_info = staticmethod(_file_info_from_dict)
@@ -0,0 +1,107 @@
+"""
+Server-Sent Events decoding for streaming endpoints
+
+Implements the event stream parsing rules of the HTML Living Standard
+(https://html.spec.whatwg.org/multipage/server-sent-events.html): CR, LF and
+CRLF line endings, comment lines, and the ``event``, ``data``, ``id`` and
+``retry`` fields.
+"""
+
+from dataclasses import dataclass
+from typing import List, Optional
+
+
+@dataclass(slots=True)
+class ServerSentEvent:
+    """A single dispatched SSE event"""
+    data: bytes
+    event: str = "message"
+    id: Optional[str] = None
+    retry: Optional[int] = None
+
+
+class SSEDecoder:
+    """Incremental decoder that turns an SSE byte stream into events"""
+
+    def __init__(self) -> None:
+        self._buffer = bytearray()
+        self._skip_lf = False
+        self._data: List[bytes] = []
+        self._event = ""
+        self._last_id: Optional[str] = None
+        self._retry: Optional[int] = None
+
+    @property
+    def last_event_id(self) -> Optional[str]:
+        """The most recent ``id`` field, for resuming with ``Last-Event-ID``"""
+        return self._last_id
+
+    def feed(self, chunk: bytes) -> List[ServerSentEvent]:
+        """
+        Feed a chunk of the response body.
+
+        Returns:
+            Every event completed by this chunk; ``data`` is left undecoded
+        """
+        if not chunk:
+            return []
+        if self._skip_lf:
+            # The previous chunk ended in CR; drop the LF of a split CRLF
+            self._skip_lf = False
+            if chunk[:1] == b"\n":
+                chunk = chunk[1:]
+
+        buffer = self._buffer
+        # Everything before the new chunk is an unterminated line, so only
+        # the new bytes are scanned; a long data line arriving in many
+        # chunks is not rescanned on every feed
+        scan_from = len(buffer)
+        buffer += chunk
+        end = max(buffer.rfind(b"\n", scan_from), buffer.rfind(b"\r", scan_from))
+        if end == -1:
+            return []
+
+        self._skip_lf = end == len(buffer) - 1 and buffer[end] == 0x0D
+        lines = bytes(buffer[: end + 1]).splitlines()
+        del buffer[: end + 1]
+
+        events = []
+        for line in lines:
+            if not line:
+                event = self._dispatch()
+                if event is not None:
+                    events.append(event)
+            elif line[0] != 0x3A:  # lines starting with ":" are comments
+                self._process_field(line)
+        return events
+
+    def _process_field(self, line: bytes) -> None:
+        """Apply a single ``field: value`` line to the pending event"""
+        name, _, value = line.partition(b":")
+        if value[:1] == b" ":
+            value = value[1:]
+
+        if name == b"data":
+            self._data.append(value)
+        elif name == b"event":
+            self._event = value.decode("utf-8", "replace")
+        elif name == b"id":
+            if b"\0" not in value:
+                self._last_id = value.decode("utf-8", "replace")
+        elif name == b"retry":
+            if value.isdigit():
+                self._retry = int(value)
+
+    def _dispatch(self) -> Optional[ServerSentEvent]:
+        """Finish the pending event at a blank line"""
+        data, event = self._data, self._event
+        self._data = []
+        self._event = ""
+        if not data:
+            return None
+        return ServerSentEvent(
+            data=b"\n".join(data),
+            event=event or "message",
+            id=self._last_id,
+            retry=self._retry,
+        )
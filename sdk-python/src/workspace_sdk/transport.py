@@ -0,0 +1,193 @@
+"""
+HTTP transport configuration shared by the sync and async clients
+"""
+
+import asyncio
+import socket
+import ssl
+from functools import lru_cache
+from typing import Optional
+
+import httpx
+
+from workspace_sdk.auth import BearerAuth
+from workspace_sdk.serialization import AsyncJsonClient, JsonClient
+
+DEFAULT_MAX_CONNECTIONS = 200
+DEFAULT_MAX_KEEPALIVE = 100
+DEFAULT_KEEPALIVE_EXPIRY = 30.0
+DEFAULT_RETRIES = 1
+SHARED_TRANSPORT_RETRIES = 2
+PREWARM_TIMEOUT = 2.0
+
+ACCEPT_HEADERS = {"Accept": "application/json"}
+
+# Disable Nagle's algorithm so small JSON request/response pairs are not held
+# back by delayed ACKs, and keep idle pooled connections alive.
+DEFAULT_SOCKET_OPTIONS = [
+    (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+]
+
+
+@lru_cache(maxsize=None)
+def default_ssl_context() -> ssl.SSLContext:
+    """
+    Return the process-wide SSL context used by SDK transports.
+
+    Built on first use with httpx's defaults and reused afterwards, so
+    creating more clients does not reload the CA bundle each time.
+    """
+    return httpx.create_ssl_context()
+
+
+def build_limits(
+    max_connections: int = DEFAULT_MAX_CONNECTIONS,
+    max_keepalive: int = DEFAULT_MAX_KEEPALIVE,
+) -> httpx.Limits:
+    """Build connection pool limits for the SDK transports"""
+    return httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_keepalive,
+        keepalive_expiry=DEFAULT_KEEPALIVE_EXPIRY,
+    )
+
+
+def build_transport(
+    max_connections: int = DEFAULT_MAX_CONNECTIONS,
+    max_keepalive: int = DEFAULT_MAX_KEEPALIVE,
+    retries: int = DEFAULT_RETRIES,
+    ssl_context: Optional[ssl.SSLContext] = None,
+) -> httpx.HTTPTransport:
+    """Build an HTTP/2-enabled pooled transport for the sync client"""
+    return httpx.HTTPTransport(
+        verify=ssl_context or default_ssl_context(),
+        http2=True,
+        limits=build_limits(max_connections, max_keepalive),
+        retries=retries,
+        socket_options=DEFAULT_SOCKET_OPTIONS,
+    )
+
+
+def build_async_transport(
+    max_connections: int = DEFAULT_MAX_CONNECTIONS,
+    max_keepalive: int = DEFAULT_MAX_KEEPALIVE,
+    retries: int = DEFAULT_RETRIES,
+    ssl_context: Optional[ssl.SSLContext] = None,
+) -> httpx.AsyncHTTPTransport:
+    """Build an HTTP/2-enabled pooled transport for the async client"""
+    return httpx.AsyncHTTPTransport(
+        verify=ssl_context or default_ssl_context(),
+        http2=True,
+        limits=build_limits(max_connections, max_keepalive),
+        retries=retries,
+        socket_options=DEFAULT_SOCKET_OPTIONS,
+    )
+
+
+def create_shared_transport(
+    max_connections: int = DEFAULT_MAX_CONNECTIONS,
+    max_keepalive: int = DEFAULT_MAX_KEEPALIVE,
+    ssl_context: Optional[ssl.SSLContext] = None,
+) -> httpx.AsyncHTTPTransport:
+    """
+    Create an async transport meant to be shared by many AsyncWorkspaceClient instances.
+
+    Clients given this transport reuse its connection pool and leave it open
+    on exit, so it should outlive them; close it with ``await transport.aclose()``
+    when the application shuts down.
+
+    Usage:
+        transport = create_shared_transport()
+
+        async with AsyncWorkspaceClient(api_url, transport=transport) as client:
+            ...
+
+        await transport.aclose()
+    """
+    return build_async_transport(
+        max_connections, max_keepalive, SHARED_TRANSPORT_RETRIES, ssl_context
+    )
+
+
+def api_base_url(api_url: str) -> str:
+    """Return the versioned API root for a server URL"""
+    return f"{api_url.rstrip('/')}/api/v1"
+
+
+def build_client(
+    api_url: str,
+    api_key: Optional[str] = None,
+    timeout: float = 30.0,
+    max_connections: int = DEFAULT_MAX_CONNECTIONS,
+    max_keepalive: int = DEFAULT_MAX_KEEPALIVE,
+    ssl_context: Optional[ssl.SSLContext] = None,
+) -> JsonClient:
+    """
+    Build a pooled, HTTP/2-enabled sync client for the workspace API.
+
+    The result can be passed to a service directly, e.g.
+    ``WorkspaceService(build_client(api_url), api_base_url(api_url))``.
+    """
+    return JsonClient(
+        base_url=api_base_url(api_url),
+        headers=ACCEPT_HEADERS,
+        auth=BearerAuth(api_key) if api_key else None,
+        timeout=timeout,
+        transport=build_transport(max_connections, max_keepalive, ssl_context=ssl_context),
+    )
+
+
+def build_async_client(
+    api_url: str,
+    api_key: Optional[str] = None,
+    timeout: float = 30.0,
+    max_connections: int = DEFAULT_MAX_CONNECTIONS,
+    max_keepalive: int = DEFAULT_MAX_KEEPALIVE,
+    ssl_context: Optional[ssl.SSLContext] = None,
+    transport: Optional[httpx.AsyncBaseTransport] = None,
+) -> AsyncJsonClient:
+    """
+    Build a pooled, HTTP/2-enabled async client for the workspace API.
+
+    Concurrent calls made through it share the pool, and over HTTPS they are
+    multiplexed on one connection:
+
+        async with build_async_client(api_url) as http:
+            files = AsyncWorkspaceService(http, api_base_url(api_url))
+            infos = await asyncio.gather(
+                *(files.get_file_info(workspace_id, path) for path in paths)
+            )
+    """
+    return AsyncJsonClient(
+        base_url=api_base_url(api_url),
+        headers=ACCEPT_HEADERS,
+        auth=BearerAuth(api_key) if api_key else None,
+        timeout=timeout,
+        transport=transport
+        or build_async_transport(max_connections, max_keepalive, ssl_context=ssl_context),
+    )
+
+
+class BoundedAsyncTransport(httpx.AsyncBaseTransport):
+    """Async transport wrapper that caps the number of requests in flight"""
+
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport,
+        semaphore: asyncio.Semaphore,
+        close_transport: bool = True,
+    ):
+        self._transport = transport
+        self._semaphore = semaphore
+        self._close_transport = close_transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        # The permit covers sending the request and receiving the response
+        # headers; streamed bodies are read after it is released.
+        async with self._semaphore:
+            return await self._transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        if self._close_transport:
+            await self._transport.aclose()
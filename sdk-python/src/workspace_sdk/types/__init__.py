@@ -2,8 +2,11 @@
 Type definitions for the Workspace SDK
 """
 
+import asyncio
 from dataclasses import dataclass, field
-from typing import Optional, Dict, List, Literal, Callable, Awaitable
+from typing import (
+    Any, Optional, Dict, Literal, Callable, Awaitable, ClassVar, Mapping, Sequence, TypeVar
+)
 from datetime import datetime
 
 
@@ -11,7 +14,7 @@ SandboxState = Literal["starting", "running", "stopping", "stopped", "error"]
 FileType = Literal["file", "directory", "symlink"]
 
 
-@dataclass
+@dataclass(slots=True)
 class Workspace:
     """Workspace resource"""
     id: str
@@ -22,14 +25,14 @@ class Workspace:
     metadata: Optional[Dict[str, str]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CreateWorkspaceParams:
     """Parameters for creating a workspace"""
     name: Optional[str] = None
     metadata: Optional[Dict[str, str]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Sandbox:
     """Sandbox resource"""
     id: str
@@ -45,7 +48,7 @@ class Sandbox:
     error_message: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CreateSandboxParams:
     """Parameters for creating a sandbox"""
     workspace_id: str
@@ -56,7 +59,7 @@ class CreateSandboxParams:
     timeout: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CommandResult:
     """Command execution result"""
     exit_code: int
@@ -64,47 +67,70 @@ class CommandResult:
     stderr: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RunCommandOptions:
     """Options for running a command"""
-    args: Optional[List[str]] = None
+    args: Optional[Sequence[str]] = None
     env: Optional[Dict[str, str]] = None
     cwd: Optional[str] = None
     timeout: Optional[int] = None
 
+    def __post_init__(self) -> None:
+        if self.args is not None and not isinstance(self.args, tuple):
+            object.__setattr__(self, "args", tuple(self.args))
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class StdoutEvent:
     """Standard output event"""
-    type: Literal["stdout"]
+    type: ClassVar[Literal["stdout"]] = "stdout"
     data: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class StderrEvent:
     """Standard error event"""
-    type: Literal["stderr"]
+    type: ClassVar[Literal["stderr"]] = "stderr"
     data: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ExitEvent:
     """Process exit event"""
-    type: Literal["exit"]
+    type: ClassVar[Literal["exit"]] = "exit"
     code: int
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ErrorEvent:
     """Error event"""
-    type: Literal["error"]
+    type: ClassVar[Literal["error"]] = "error"
     message: str
 
 
 ProcessEvent = StdoutEvent | StderrEvent | ExitEvent | ErrorEvent
 
+_T = TypeVar("_T")
+
+
+def dispatch(event: ProcessEvent, handlers: Mapping[str, Callable[[Any], _T]]) -> Optional[_T]:
+    """
+    Call the handler registered for ``event.type``.
+
+    A single dict lookup on the event tag, instead of an ``isinstance`` chain:
+
+        handlers = {"stdout": on_stdout, "exit": on_exit}
+        for event in events:
+            dispatch(event, handlers)
+
+    Returns:
+        The handler's result, or None if no handler matches the event type
+    """
+    handler = handlers.get(event.type)
+    return handler(event) if handler is not None else None
 
-@dataclass
+
+@dataclass(slots=True)
 class PtyOptions:
     """PTY creation options"""
     cols: int = 80
@@ -113,7 +139,7 @@ class PtyOptions:
     env: Optional[Dict[str, str]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PtyHandle:
     """PTY handle for interacting with a terminal"""
     id: str
@@ -124,13 +150,34 @@ class PtyHandle:
     _kill: Callable[[], Awaitable[None]] = field(repr=False)
     _on_data: Callable[[Callable[[bytes], None]], None] = field(repr=False)
     _on_close: Callable[[Callable[[], None]], None] = field(repr=False)
+    _read: Optional[Callable[[], Awaitable[bytes]]] = field(default=None, repr=False)
+    _receive_task: Optional["asyncio.Task[None]"] = field(default=None, repr=False)
 
     async def write(self, data: bytes | str) -> None:
-        """Write data to the PTY"""
+        """
+        Write data to the PTY.
+
+        Writes issued in the same event loop tick are sent as one WebSocket
+        frame; this only waits for the socket once 64 KiB are pending.
+        """
         if isinstance(data, str):
             data = data.encode()
         await self._write(data)
 
+    async def read(self) -> bytes:
+        """
+        Read output received since the last call, waiting if there is none.
+
+        Only output that arrives while no ``on_data`` callback is registered
+        is buffered here.
+
+        Returns:
+            The pending output, or b"" once the PTY is closed
+        """
+        if self._read is None:
+            return b""
+        return await self._read()
+
     async def resize(self, cols: int, rows: int) -> None:
         """Resize the PTY"""
         await self._resize(cols, rows)
@@ -148,7 +195,7 @@ class PtyHandle:
         self._on_close(callback)
 
 
-@dataclass
+@dataclass(slots=True)
 class FileInfo:
     """File information"""
     name: str
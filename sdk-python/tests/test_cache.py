@@ -0,0 +1,48 @@
+"""Tests for TTLCache"""
+
+import pytest
+
+from workspace_sdk import cache
+from workspace_sdk.cache import TTLCache
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> list:
+    now = [100.0]
+    monkeypatch.setattr(cache.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_entries_expire_after_the_callers_ttl(clock: list) -> None:
+    entries = TTLCache()
+    entries.put("a", 1)
+    clock[0] += 5
+    assert entries.get("a", ttl=10) == 1
+    assert entries.get("a", ttl=5) is None
+
+
+def test_non_positive_ttl_never_hits(clock: list) -> None:
+    entries = TTLCache()
+    entries.put("a", 1)
+    assert entries.get("a", ttl=0) is None
+    assert entries.get("missing", ttl=10) is None
+
+
+def test_oldest_entry_is_evicted_when_full(clock: list) -> None:
+    entries = TTLCache(maxsize=2)
+    entries.put("a", 1)
+    entries.put("b", 2)
+    # Storing again makes "a" the newest entry
+    entries.put("a", 3)
+    entries.put("c", 4)
+    assert entries.get("b", ttl=10) is None
+    assert entries.get("a", ttl=10) == 3
+    assert entries.get("c", ttl=10) == 4
+
+
+def test_invalidate(clock: list) -> None:
+    entries = TTLCache()
+    entries.put("a", 1)
+    entries.invalidate("a")
+    entries.invalidate("missing")
+    assert entries.get("a", ttl=10) is None
@@ -0,0 +1,37 @@
+"""Tests for taskgroup_gather"""
+
+import asyncio
+
+import pytest
+
+from workspace_sdk.eventloop import taskgroup_gather
+
+
+def test_results_are_returned_in_order() -> None:
+    async def value(delay: float, result: int) -> int:
+        await asyncio.sleep(delay)
+        return result
+
+    results = asyncio.run(
+        taskgroup_gather([value(0.02, 1), value(0, 2), value(0.01, 3)], max_concurrency=2)
+    )
+    assert results == [1, 2, 3]
+
+
+def test_first_failure_is_raised_unwrapped_and_cancels_the_rest() -> None:
+    cancelled = []
+
+    async def fail() -> None:
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    async def slow() -> None:
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    with pytest.raises(ValueError, match="boom"):
+        asyncio.run(taskgroup_gather([fail(), slow(), slow()]))
+    assert cancelled == [True, True]
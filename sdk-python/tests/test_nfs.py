@@ -0,0 +1,112 @@
+"""Tests for NfsMount"""
+
+import os
+import subprocess
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List
+
+import pytest
+
+from workspace_sdk.services import nfs
+from workspace_sdk.services.nfs import NfsMount
+
+
+def _mount(mount_point: Path) -> NfsMount:
+    # copy_into only needs a mount point; no NFS mount is made
+    return NfsMount("localhost", 2049, "/workspace", mount_point=str(mount_point))
+
+
+def test_copy_into_keeps_directory_symlinks_as_links(tmp_path: Path) -> None:
+    src = tmp_path / "src"
+    (src / "real").mkdir(parents=True)
+    (src / "real" / "data.txt").write_text("payload")
+    os.symlink("real", src / "alias")
+    share = tmp_path / "share"
+
+    _mount(share).copy_into("staged", [src])
+
+    alias = share / "staged" / "src" / "alias"
+    assert alias.is_symlink()
+    assert os.readlink(alias) == "real"
+    assert (alias / "data.txt").read_text() == "payload"
+
+
+def test_copy_into_copies_broken_symlinks(tmp_path: Path) -> None:
+    src = tmp_path / "src"
+    src.mkdir()
+    (src / "file.txt").write_text("ok")
+    os.symlink("missing.txt", src / "dangling")
+    os.symlink("gone", tmp_path / "top-level-dangling")
+    share = tmp_path / "share"
+
+    _mount(share).copy_into("staged", [src, tmp_path / "top-level-dangling"])
+
+    dangling = share / "staged" / "src" / "dangling"
+    assert dangling.is_symlink()
+    assert os.readlink(dangling) == "missing.txt"
+    assert os.readlink(share / "staged" / "top-level-dangling") == "gone"
+    assert (share / "staged" / "src" / "file.txt").read_text() == "ok"
+
+
+@pytest.fixture
+def commands(monkeypatch: pytest.MonkeyPatch) -> List[List[str]]:
+    """Record mount/umount commands instead of running them"""
+    ran: List[List[str]] = []
+
+    def run(cmd: List[str], **kwargs) -> subprocess.CompletedProcess:
+        # mount/umount can block for a long time; they must not hold the lock
+        assert not nfs._registry_lock.locked()
+        time.sleep(0.05)
+        ran.append(cmd)
+        return subprocess.CompletedProcess(cmd, 0)
+
+    monkeypatch.setattr(nfs.subprocess, "run", run)
+    return ran
+
+
+def test_concurrent_mounts_of_one_export_share_the_nfs_mount(
+    tmp_path: Path, commands: List[List[str]]
+) -> None:
+    registry: Dict[nfs.MountKey, NfsMount] = {}
+    mounts = [
+        NfsMount("localhost", 2049, "/workspace", str(tmp_path / f"m{i}"), registry=registry)
+        for i in range(4)
+    ]
+    threads = [threading.Thread(target=mount.mount) for mount in mounts]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert [cmd[1] for cmd in commands].count("-t") == 1
+    assert [cmd[1] for cmd in commands].count("--bind") == 3
+
+    for mount in mounts:
+        mount.unmount()
+    assert registry == {}
+    assert len([cmd for cmd in commands if cmd[0] == "umount"]) == 4
+
+
+def test_mount_waits_for_the_last_unmount_of_its_export(
+    tmp_path: Path, commands: List[List[str]]
+) -> None:
+    registry: Dict[nfs.MountKey, NfsMount] = {}
+    first = NfsMount("localhost", 2049, "/workspace", str(tmp_path / "a"), registry=registry)
+    second = NfsMount("localhost", 2049, "/workspace", str(tmp_path / "b"), registry=registry)
+    first.mount()
+
+    unmounting = threading.Thread(target=first.unmount)
+    unmounting.start()
+    time.sleep(0.01)
+    second.mount()
+    unmounting.join()
+
+    # The export was unmounted, so the second mount is a fresh NFS mount
+    assert [cmd[:2] for cmd in commands] == [
+        ["mount", "-t"],
+        ["umount", str(tmp_path / "a")],
+        ["mount", "-t"],
+    ]
+    assert registry == {second.key: second}
@@ -0,0 +1,108 @@
+"""Tests for the PTY read and write buffers"""
+
+import asyncio
+from typing import List
+
+import pytest
+
+from workspace_sdk.services import pty
+from workspace_sdk.services.pty import _PtyReadBuffer, _PtyWriteBuffer
+
+
+class _FakeWebSocket:
+    def __init__(self, fail: bool = False):
+        self.frames: List[bytes] = []
+        self.fail = fail
+
+    async def send(self, frame: bytes) -> None:
+        await asyncio.sleep(0)
+        if self.fail:
+            raise ConnectionError("closed")
+        self.frames.append(frame)
+
+
+def test_read_buffer_returns_everything_pending_in_one_call() -> None:
+    async def main() -> None:
+        buffer = _PtyReadBuffer()
+        buffer.append(b"ab")
+        buffer.append(b"cd")
+        assert await buffer.get() == b"abcd"
+
+        reader = asyncio.ensure_future(buffer.get())
+        await asyncio.sleep(0)
+        assert not reader.done()
+        buffer.append(b"e")
+        assert await reader == b"e"
+
+    asyncio.run(main())
+
+
+def test_read_buffer_drains_before_reporting_close() -> None:
+    async def main() -> None:
+        buffer = _PtyReadBuffer()
+        reader = asyncio.ensure_future(buffer.get())
+        await asyncio.sleep(0)
+        buffer.close()
+        assert await reader == b""
+
+        buffer = _PtyReadBuffer()
+        buffer.append(b"tail")
+        buffer.close()
+        assert await buffer.get() == b"tail"
+        assert await buffer.get() == b""
+
+    asyncio.run(main())
+
+
+def test_read_buffer_drops_oldest_output_over_the_limit(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(pty, "PTY_READ_BUFFER_LIMIT", 8)
+
+    async def main() -> None:
+        buffer = _PtyReadBuffer()
+        for chunk in (b"1111", b"2222", b"3333"):
+            buffer.append(chunk)
+        assert await buffer.get() == b"22223333"
+        # A single chunk over the limit is kept whole
+        buffer.append(b"x" * 20)
+        assert await buffer.get() == b"x" * 20
+
+    asyncio.run(main())
+
+
+def test_write_buffer_coalesces_writes_from_one_tick() -> None:
+    async def main() -> None:
+        ws = _FakeWebSocket()
+        buffer = _PtyWriteBuffer(ws)
+        for key in (b"l", b"s", b"\r"):
+            await buffer.write(key)
+        await buffer.drain()
+        assert ws.frames == [b"ls\r"]
+
+    asyncio.run(main())
+
+
+def test_write_buffer_caps_frames_at_the_limit(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(pty, "PTY_WRITE_BUFFER_LIMIT", 4)
+
+    async def main() -> None:
+        ws = _FakeWebSocket()
+        buffer = _PtyWriteBuffer(ws)
+        for _ in range(5):
+            await buffer.write(b"ab")
+        await buffer.drain()
+        assert b"".join(ws.frames) == b"ab" * 5
+        assert all(len(frame) <= 4 for frame in ws.frames)
+
+    asyncio.run(main())
+
+
+def test_write_buffer_raises_send_failures_on_the_next_call() -> None:
+    async def main() -> None:
+        buffer = _PtyWriteBuffer(_FakeWebSocket(fail=True))
+        await buffer.write(b"x")
+        with pytest.raises(ConnectionError):
+            await buffer.drain()
+        with pytest.raises(ConnectionError):
+            await buffer.write(b"y")
+
+    asyncio.run(main())
@@ -0,0 +1,235 @@
+"""Tests for the sandbox create/delete batch scheduler"""
+
+import asyncio
+import json
+from typing import Awaitable, Callable, List, Optional
+
+import httpx
+import pytest
+
+from workspace_sdk.services.sandbox import AsyncSandboxService, SandboxService
+from workspace_sdk.types import CreateSandboxParams
+
+
+def _sandbox(name: str) -> dict:
+    return {
+        "id": f"id-{name}",
+        "workspace_id": "w",
+        "template": "default",
+        "state": "running",
+        "created_at": "2024-01-01T00:00:00Z",
+        "updated_at": "2024-01-01T00:00:00Z",
+        "name": name,
+    }
+
+
+def _params(count: int) -> List[CreateSandboxParams]:
+    return [CreateSandboxParams(workspace_id="w", name=f"s{i}") for i in range(count)]
+
+
+def _run(
+    handler: Callable[[httpx.Request], Awaitable[httpx.Response]],
+    test: Callable[[AsyncSandboxService], Awaitable[None]],
+    max_batch_size: int = 32,
+    batch_window_ms: float = 10_000,
+) -> None:
+    async def main() -> None:
+        async with httpx.AsyncClient(
+            base_url="http://test/api/v1", transport=httpx.MockTransport(handler)
+        ) as client:
+            service = AsyncSandboxService(
+                client,
+                "http://test/api/v1",
+                max_batch_size=max_batch_size,
+                batch_window_ms=batch_window_ms,
+            )
+            await asyncio.wait_for(test(service), timeout=5)
+
+    asyncio.run(main())
+
+
+class _Server:
+    """Records requests and answers creates, optionally holding unary ones back"""
+
+    def __init__(self, batch_status: int = 200, results: Optional[list] = None):
+        self.requests: List[tuple] = []
+        self.batch_status = batch_status
+        self.results = results
+        self.release = asyncio.Event()
+        self.release.set()
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path[len("/api/v1"):]
+        body = json.loads(request.content)
+        if path == "/sandboxes/batch":
+            names = [item["name"] for item in body["sandboxes"]]
+            self.requests.append((path, names))
+            # A batch arriving releases any held unary request
+            self.release.set()
+            if self.batch_status != 200:
+                return httpx.Response(self.batch_status)
+            results = self.results
+            if results is None:
+                results = [{"status": 201, "sandbox": _sandbox(name)} for name in names]
+            return httpx.Response(200, json={"results": results})
+        self.requests.append((path, [body["name"]]))
+        await self.release.wait()
+        return httpx.Response(201, json=_sandbox(body["name"]))
+
+    def paths(self) -> List[str]:
+        return [path for path, _ in self.requests]
+
+
+def test_lone_create_is_sent_unary() -> None:
+    server = _Server()
+
+    async def test(service: AsyncSandboxService) -> None:
+        sandbox = await service.create(CreateSandboxParams(workspace_id="w", name="s0"))
+        assert sandbox.name == "s0"
+
+    _run(server, test)
+    assert server.requests == [("/sandboxes", ["s0"])]
+
+
+def test_full_batch_is_flushed_without_waiting_for_the_window() -> None:
+    server = _Server()
+
+    async def test(service: AsyncSandboxService) -> None:
+        sandboxes = await service.create_many(_params(5))
+        assert [s.name for s in sandboxes] == [f"s{i}" for i in range(5)]
+
+    # The first create goes out at once; the next four fill a batch
+    _run(server, test, max_batch_size=4)
+    assert sorted(server.requests) == [
+        ("/sandboxes", ["s0"]),
+        ("/sandboxes/batch", ["s1", "s2", "s3", "s4"]),
+    ]
+
+
+def test_partial_batch_is_flushed_by_the_timer() -> None:
+    async def test(service: AsyncSandboxService) -> None:
+        # The unary create stays in flight until the batch arrives, so only
+        # the window timer can send the batch
+        server.release.clear()
+        sandboxes = await service.create_many(_params(3))
+        assert [s.name for s in sandboxes] == ["s0", "s1", "s2"]
+
+    server = _Server()
+    _run(server, test, batch_window_ms=10)
+    assert server.requests == [
+        ("/sandboxes", ["s0"]),
+        ("/sandboxes/batch", ["s1", "s2"]),
+    ]
+
+
+@pytest.mark.parametrize("status", [404, 405])
+def test_server_without_batch_endpoint_falls_back_to_unary(status: int) -> None:
+    server = _Server(batch_status=status)
+
+    async def test(service: AsyncSandboxService) -> None:
+        sandboxes = await service.create_many(_params(3))
+        assert [s.name for s in sandboxes] == ["s0", "s1", "s2"]
+        # Later batches skip the batch endpoint
+        await service.create_many(_params(3))
+
+    _run(server, test, max_batch_size=2)
+    # One unary create each, plus the single batch attempt
+    assert sorted(server.paths()) == ["/sandboxes"] * 6 + ["/sandboxes/batch"]
+
+
+def test_failed_batch_item_raises_for_its_caller_only() -> None:
+    server = _Server(
+        results=[
+            {"status": 201, "sandbox": _sandbox("s1")},
+            {"status": 409, "error": {"code": 2002, "message": "exists"}},
+            {"sandbox": _sandbox("s3")},
+        ]
+    )
+
+    async def test(service: AsyncSandboxService) -> None:
+        results = await service.create_many(_params(4), return_exceptions=True)
+        assert results[0].name == "s0"
+        assert results[1].name == "s1"
+        assert isinstance(results[2], httpx.HTTPStatusError)
+        assert results[2].response.status_code == 409
+        # An entry without a status is malformed
+        assert isinstance(results[3], httpx.DecodingError)
+
+    _run(server, test, max_batch_size=3)
+
+
+def test_batch_response_with_wrong_result_count_fails_the_batch() -> None:
+    server = _Server(results=[{"status": 201, "sandbox": _sandbox("s1")}])
+
+    async def test(service: AsyncSandboxService) -> None:
+        results = await service.create_many(_params(3), return_exceptions=True)
+        assert results[0].name == "s0"
+        assert isinstance(results[1], httpx.DecodingError)
+        assert isinstance(results[2], httpx.DecodingError)
+
+    _run(server, test, max_batch_size=2)
+
+
+def test_cancelled_create_is_never_sent() -> None:
+    server = _Server()
+
+    async def test(service: AsyncSandboxService) -> None:
+        server.release.clear()
+        first = asyncio.ensure_future(
+            service.create(CreateSandboxParams(workspace_id="w", name="s0"))
+        )
+        await asyncio.sleep(0)
+        second = asyncio.ensure_future(
+            service.create(CreateSandboxParams(workspace_id="w", name="s1"))
+        )
+        await asyncio.sleep(0)
+        second.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await second
+
+        server.release.set()
+        assert (await first).name == "s0"
+        await asyncio.sleep(0.05)
+
+    _run(server, test)
+    assert server.requests == [("/sandboxes", ["s0"])]
+
+
+def _sync_service(handler: Callable[[httpx.Request], httpx.Response]) -> SandboxService:
+    client = httpx.Client(base_url="http://test/api/v1", transport=httpx.MockTransport(handler))
+    return SandboxService(client, "http://test/api/v1")
+
+
+def test_sync_create_many_checks_the_result_count() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"results": [{"status": 201, "sandbox": _sandbox("s0")}]})
+
+    results = _sync_service(handler).create_many(_params(2), return_exceptions=True)
+    assert all(isinstance(result, httpx.DecodingError) for result in results)
+    with pytest.raises(httpx.DecodingError):
+        _sync_service(handler).create_many(_params(2))
+
+
+def test_sync_create_many_reports_malformed_entries_per_item() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        results = [{"status": 201, "sandbox": _sandbox("s0")}, {"status": 201}, "oops"]
+        return httpx.Response(200, json={"results": results})
+
+    results = _sync_service(handler).create_many(_params(3), return_exceptions=True)
+    assert results[0].name == "s0"
+    assert isinstance(results[1], httpx.DecodingError)
+    assert isinstance(results[2], httpx.DecodingError)
+
+
+def test_sync_fallback_keeps_created_sandboxes_on_transport_errors() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/batch"):
+            return httpx.Response(405)
+        body = json.loads(request.content)
+        if body["name"] == "s1":
+            raise httpx.ConnectError("connection refused", request=request)
+        return httpx.Response(201, json=_sandbox(body["name"]))
+
+    results = _sync_service(handler).create_many(_params(3), return_exceptions=True)
+    assert [getattr(result, "name", None) for result in results] == ["s0", None, "s2"]
+    assert isinstance(results[1], httpx.ConnectError)
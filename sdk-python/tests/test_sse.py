@@ -0,0 +1,60 @@
+"""Tests for SSEDecoder"""
+
+from typing import List
+
+import pytest
+
+from workspace_sdk.sse import ServerSentEvent, SSEDecoder
+
+
+def _feed(*chunks: bytes) -> List[ServerSentEvent]:
+    decoder = SSEDecoder()
+    events = []
+    for chunk in chunks:
+        events.extend(decoder.feed(chunk))
+    return events
+
+
+@pytest.mark.parametrize("newline", [b"\n", b"\r", b"\r\n"])
+def test_line_endings(newline: bytes) -> None:
+    stream = newline.join([b"event: stdout", b"data: one", b"", b"data: two", b"", b""])
+    events = _feed(stream)
+    assert [(e.event, e.data) for e in events] == [("stdout", b"one"), ("message", b"two")]
+
+
+def test_crlf_split_across_chunks_is_one_line_ending() -> None:
+    # A stray LF at the start of the second chunk would end the event early
+    events = _feed(b"data: a\r", b"\ndata: b\r\n\r\n")
+    assert [e.data for e in events] == [b"a\nb"]
+
+
+def test_fields_split_across_chunks() -> None:
+    events = _feed(b"da", b"ta: hel", b"lo\n", b"\n")
+    assert [e.data for e in events] == [b"hello"]
+
+
+def test_comments_are_ignored() -> None:
+    events = _feed(b": keep-alive\n\ndata: x\n: between\n\n")
+    assert [e.data for e in events] == [b"x"]
+
+
+def test_multi_line_data_is_joined_with_newlines() -> None:
+    events = _feed(b"data: a\ndata:b\ndata\n\n")
+    assert [e.data for e in events] == [b"a\nb\n"]
+
+
+def test_id_containing_nul_is_ignored() -> None:
+    decoder = SSEDecoder()
+    events = decoder.feed(b"id: 1\ndata: x\n\nid: a\0b\ndata: y\n\n")
+    assert [e.id for e in events] == ["1", "1"]
+    assert decoder.last_event_id == "1"
+
+
+def test_retry_accepts_only_digits() -> None:
+    events = _feed(b"retry: 3000\ndata: x\n\nretry: soon\ndata: y\n\n")
+    assert [e.retry for e in events] == [3000, 3000]
+
+
+def test_trailing_event_without_blank_line_is_not_dispatched() -> None:
+    assert _feed(b"data: x\n\ndata: partial\n") == [ServerSentEvent(data=b"x")]
+    assert _feed(b"data: unterminated") == []
@@ -34,21 +34,36 @@ pub fn create_router(state: AppState) -> Router {
         .route("/workspaces/{id}/files", get(workspace::read_file))
         .route("/workspaces/{id}/files", put(workspace::write_file))
         .route("/workspaces/{id}/files", delete(workspace::delete_file))
+        .route("/workspaces/{id}/files/raw", get(workspace::download_file))
+        .route("/workspaces/{id}/files/raw", put(workspace::upload_file))
         .route("/workspaces/{id}/files/list", get(workspace::list_files))
         .route("/workspaces/{id}/files/mkdir", post(workspace::mkdir))
         .route("/workspaces/{id}/files/move", post(workspace::move_file))
         .route("/workspaces/{id}/files/copy", post(workspace::copy_file))
         .route("/workspaces/{id}/files/info", get(workspace::get_file_info))
+        .route(
+            "/workspaces/{id}/files/batch/info",
+            post(workspace::batch_get_file_info),
+        )
+        .route(
+            "/workspaces/{id}/files/batch/read",
+            post(workspace::batch_read_files),
+        )
         // Sandbox routes
         .route("/sandboxes", post(sandbox::create_sandbox))
         .route("/sandboxes", get(sandbox::list_sandboxes))
+        .route("/sandboxes/batch", post(sandbox::batch_create_sandboxes))
+        .route(
+            "/sandboxes/batch/delete",
+            post(sandbox::batch_delete_sandboxes),
+        )
         .route("/sandboxes/{id}", get(sandbox::get_sandbox))
         .route("/sandboxes/{id}", delete(sandbox::delete_sandbox))
         // Process routes
         .route("/sandboxes/{id}/process/run", post(process::run_command))
         .route(
             "/sandboxes/{id}/process/run/stream",
-            get(process::run_command_stream),
+            get(process::run_command_stream).post(process::run_command_stream_post),
         )
         .route(
             "/sandboxes/{id}/process/{pid}/kill",
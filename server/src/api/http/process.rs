@@ -5,10 +5,11 @@ use axum::{
     response::sse::{Event, KeepAlive, Sse},
     Json,
 };
-use futures::stream::{self, Stream};
+use futures::stream::{self, Stream, StreamExt};
 use serde::{Deserialize, Serialize};
 use std::convert::Infallible;
 
+use crate::domain::types::ProcessEvent;
 use crate::service::process::RunCommandOptions;
 use crate::{AppState, Result};
 
@@ -47,21 +48,38 @@ pub struct KillProcessRequest {
     pub signal: Option<i32>,
 }
 
+impl From<RunCommandRequest> for RunCommandOptions {
+    fn from(req: RunCommandRequest) -> Self {
+        Self {
+            command: req.command,
+            args: req.args.unwrap_or_default(),
+            env: req.env.unwrap_or_default(),
+            cwd: req.cwd,
+            timeout_ms: req.timeout.unwrap_or(0),
+        }
+    }
+}
+
+/// Encode a process event as an SSE event named after its type
+fn sse_event(event: ProcessEvent) -> Event {
+    let name = match &event {
+        ProcessEvent::Stdout { .. } => "stdout",
+        ProcessEvent::Stderr { .. } => "stderr",
+        ProcessEvent::Exit { .. } => "exit",
+        ProcessEvent::Error { .. } => "error",
+    };
+    Event::default()
+        .event(name)
+        .data(serde_json::to_string(&event).unwrap())
+}
+
 /// Run a command in a sandbox
 pub async fn run_command(
     State(state): State<AppState>,
     Path(sandbox_id): Path<String>,
     Json(req): Json<RunCommandRequest>,
 ) -> Result<Json<CommandResultResponse>> {
-    let opts = RunCommandOptions {
-        command: req.command,
-        args: req.args.unwrap_or_default(),
-        env: req.env.unwrap_or_default(),
-        cwd: req.cwd,
-        timeout_ms: req.timeout.unwrap_or(0),
-    };
-
-    let result = state.process_service.run(&sandbox_id, opts).await?;
+    let result = state.process_service.run(&sandbox_id, req.into()).await?;
 
     Ok(Json(CommandResultResponse {
         exit_code: result.exit_code,
@@ -84,6 +102,26 @@ pub async fn run_command_stream(
     Sse::new(stream).keep_alive(KeepAlive::default())
 }
 
+/// Run a command with streaming output (SSE), taking the same JSON body as
+/// `run_command` instead of JSON-encoded query parameters
+pub async fn run_command_stream_post(
+    State(state): State<AppState>,
+    Path(sandbox_id): Path<String>,
+    Json(req): Json<RunCommandRequest>,
+) -> Result<Sse<impl Stream<Item = std::result::Result<Event, Infallible>>>> {
+    // The service stream borrows the sandbox ID; it holds the whole buffered
+    // agent response anyway, so collect it before leaving the handler
+    let events: Vec<ProcessEvent> = state
+        .process_service
+        .run_stream(&sandbox_id, req.into())
+        .await?
+        .collect()
+        .await;
+
+    let stream = stream::iter(events.into_iter().map(|event| Ok(sse_event(event))));
+    Ok(Sse::new(stream).keep_alive(KeepAlive::default()))
+}
+
 /// Kill a process
 pub async fn kill_process(
     State(state): State<AppState>,
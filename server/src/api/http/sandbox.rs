@@ -4,11 +4,30 @@ use axum::{
     extract::{Path, Query, State},
     Json,
 };
+use futures::stream::{self, StreamExt};
 use serde::{Deserialize, Serialize};
 
-use crate::domain::sandbox::{CreateSandboxParams, SandboxState};
+use crate::domain::sandbox::{CreateSandboxParams, Sandbox, SandboxState};
+use crate::error::{Error, ErrorResponse};
 use crate::{AppState, Result};
 
+/// Maximum number of operations accepted in one batch request (the SDK's
+/// default `max_batch_size`)
+pub const MAX_BATCH_SIZE: usize = 32;
+
+/// Batched operations run at once within a single request
+const BATCH_CONCURRENCY: usize = 8;
+
+fn check_batch_size(len: usize) -> Result<()> {
+    if len > MAX_BATCH_SIZE {
+        return Err(Error::InvalidRequest(format!(
+            "Batch of {} operations exceeds the maximum of {}",
+            len, MAX_BATCH_SIZE
+        )));
+    }
+    Ok(())
+}
+
 /// Create sandbox request
 #[derive(Debug, Deserialize)]
 pub struct CreateSandboxRequest {
@@ -36,6 +55,24 @@ pub struct SandboxResponse {
     pub error_message: Option<String>,
 }
 
+impl From<Sandbox> for SandboxResponse {
+    fn from(sandbox: Sandbox) -> Self {
+        SandboxResponse {
+            id: sandbox.id,
+            workspace_id: sandbox.workspace_id,
+            name: sandbox.name,
+            template: sandbox.template,
+            state: sandbox.state.as_str().to_string(),
+            env: Some(sandbox.env),
+            metadata: Some(sandbox.metadata),
+            created_at: sandbox.created_at.to_rfc3339(),
+            updated_at: sandbox.updated_at.to_rfc3339(),
+            timeout: Some(sandbox.timeout),
+            error_message: sandbox.error_message,
+        }
+    }
+}
+
 /// List sandboxes response
 #[derive(Debug, Serialize)]
 pub struct ListSandboxesResponse {
@@ -55,6 +92,57 @@ pub struct DeleteQuery {
     pub force: Option<String>,
 }
 
+/// Batch create sandboxes request
+#[derive(Debug, Deserialize)]
+pub struct BatchCreateSandboxesRequest {
+    pub sandboxes: Vec<CreateSandboxRequest>,
+}
+
+/// Result of a single create in a batch
+#[derive(Debug, Serialize)]
+pub struct BatchCreateResult {
+    pub status: u16,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub sandbox: Option<SandboxResponse>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub error: Option<ErrorResponse>,
+}
+
+/// Batch create sandboxes response (results are in request order)
+#[derive(Debug, Serialize)]
+pub struct BatchCreateSandboxesResponse {
+    pub results: Vec<BatchCreateResult>,
+}
+
+/// A single delete in a batch
+#[derive(Debug, Deserialize)]
+pub struct BatchDeleteItem {
+    pub id: String,
+    #[serde(default)]
+    pub force: bool,
+}
+
+/// Batch delete sandboxes request
+#[derive(Debug, Deserialize)]
+pub struct BatchDeleteSandboxesRequest {
+    pub sandboxes: Vec<BatchDeleteItem>,
+}
+
+/// Result of a single delete in a batch
+#[derive(Debug, Serialize)]
+pub struct BatchDeleteResult {
+    pub id: String,
+    pub status: u16,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub error: Option<ErrorResponse>,
+}
+
+/// Batch delete sandboxes response (results are in request order)
+#[derive(Debug, Serialize)]
+pub struct BatchDeleteSandboxesResponse {
+    pub results: Vec<BatchDeleteResult>,
+}
+
 /// Create a new sandbox
 pub async fn create_sandbox(
     State(state): State<AppState>,
@@ -158,3 +246,77 @@ pub async fn delete_sandbox(
     state.sandbox_service.delete(&id, force).await?;
     Ok(Json(serde_json::json!({ "success": true })))
 }
+
+/// Create several sandboxes in one request
+pub async fn batch_create_sandboxes(
+    State(state): State<AppState>,
+    Json(req): Json<BatchCreateSandboxesRequest>,
+) -> Result<Json<BatchCreateSandboxesResponse>> {
+    check_batch_size(req.sandboxes.len())?;
+    let creates = req.sandboxes.into_iter().map(|req| {
+        let sandbox_service = state.sandbox_service.clone();
+        async move {
+            let params = CreateSandboxParams {
+                workspace_id: req.workspace_id,
+                template: req.template,
+                name: req.name,
+                env: req.env,
+                metadata: req.metadata,
+                timeout: req.timeout,
+            };
+
+            match sandbox_service.create(params).await {
+                Ok(sandbox) => BatchCreateResult {
+                    status: 200,
+                    sandbox: Some(sandbox.into()),
+                    error: None,
+                },
+                Err(err) => BatchCreateResult {
+                    status: err.status_code().as_u16(),
+                    sandbox: None,
+                    error: Some(ErrorResponse::from(&err)),
+                },
+            }
+        }
+    });
+
+    // `buffered` bounds concurrency while keeping results in request order
+    Ok(Json(BatchCreateSandboxesResponse {
+        results: stream::iter(creates)
+            .buffered(BATCH_CONCURRENCY)
+            .collect()
+            .await,
+    }))
+}
+
+/// Delete several sandboxes in one request
+pub async fn batch_delete_sandboxes(
+    State(state): State<AppState>,
+    Json(req): Json<BatchDeleteSandboxesRequest>,
+) -> Result<Json<BatchDeleteSandboxesResponse>> {
+    check_batch_size(req.sandboxes.len())?;
+    let deletes = req.sandboxes.into_iter().map(|item| {
+        let sandbox_service = state.sandbox_service.clone();
+        async move {
+            match sandbox_service.delete(&item.id, item.force).await {
+                Ok(()) => BatchDeleteResult {
+                    id: item.id,
+                    status: 200,
+                    error: None,
+                },
+                Err(err) => BatchDeleteResult {
+                    id: item.id,
+                    status: err.status_code().as_u16(),
+                    error: Some(ErrorResponse::from(&err)),
+                },
+            }
+        }
+    });
+
+    Ok(Json(BatchDeleteSandboxesResponse {
+        results: stream::iter(deletes)
+            .buffered(BATCH_CONCURRENCY)
+            .collect()
+            .await,
+    }))
+}
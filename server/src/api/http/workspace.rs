@@ -1,11 +1,19 @@
 //! Workspace HTTP handlers
 
 use axum::{
+    body::Body,
     extract::{Path, Query, State},
+    http::header,
+    response::{IntoResponse, Response},
     Json,
 };
+use bytes::Bytes;
+use futures::future::join_all;
 use serde::{Deserialize, Serialize};
+use tokio::io::AsyncReadExt;
 
+use crate::error::ErrorResponse;
+use crate::service::workspace::FileInfo;
 use crate::{AppState, Result};
 
 // ==================== Request/Response Types ====================
@@ -46,12 +54,64 @@ pub struct FileInfoResponse {
     pub modified_at: Option<String>,
 }
 
+impl From<FileInfo> for FileInfoResponse {
+    fn from(info: FileInfo) -> Self {
+        FileInfoResponse {
+            name: info.name,
+            path: info.path,
+            file_type: info.file_type,
+            size: info.size,
+            modified_at: info.modified_at.map(|t| t.to_rfc3339()),
+        }
+    }
+}
+
 /// List files response
 #[derive(Debug, Serialize)]
 pub struct ListFilesResponse {
     pub files: Vec<FileInfoResponse>,
 }
 
+/// Batch file request
+#[derive(Debug, Deserialize)]
+pub struct BatchPathsRequest {
+    pub paths: Vec<String>,
+}
+
+/// Result of a single file info lookup in a batch
+#[derive(Debug, Serialize)]
+pub struct BatchFileInfoResult {
+    pub path: String,
+    pub status: u16,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub info: Option<FileInfoResponse>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub error: Option<ErrorResponse>,
+}
+
+/// Batch file info response (results are in request order)
+#[derive(Debug, Serialize)]
+pub struct BatchFileInfoResponse {
+    pub results: Vec<BatchFileInfoResult>,
+}
+
+/// Result of a single read in a batch
+#[derive(Debug, Serialize)]
+pub struct BatchReadFileResult {
+    pub path: String,
+    pub status: u16,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub content: Option<String>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub error: Option<ErrorResponse>,
+}
+
+/// Batch read response (results are in request order)
+#[derive(Debug, Serialize)]
+pub struct BatchReadFileResponse {
+    pub results: Vec<BatchReadFileResult>,
+}
+
 /// Read file response
 #[derive(Debug, Serialize)]
 pub struct ReadFileResponse {
@@ -180,6 +240,40 @@ pub async fn read_file(
     Ok(Json(ReadFileResponse { content }))
 }
 
+/// Chunk size used when streaming raw file downloads
+const DOWNLOAD_CHUNK_SIZE: usize = 64 * 1024;
+
+/// Stream a file's raw bytes from workspace
+pub async fn download_file(
+    State(state): State<AppState>,
+    Path(workspace_id): Path<String>,
+    Query(query): Query<PathQuery>,
+) -> Result<Response> {
+    let (file, size) = state
+        .workspace_service
+        .open_file(&workspace_id, &query.path)
+        .await?;
+
+    let stream = futures::stream::try_unfold(file, |mut file| async move {
+        let mut buf = vec![0u8; DOWNLOAD_CHUNK_SIZE];
+        let n = file.read(&mut buf).await?;
+        if n == 0 {
+            return Ok::<_, std::io::Error>(None);
+        }
+        buf.truncate(n);
+        Ok(Some((Bytes::from(buf), file)))
+    });
+
+    Ok((
+        [
+            (header::CONTENT_TYPE, "application/octet-stream".to_string()),
+            (header::CONTENT_LENGTH, size.to_string()),
+        ],
+        Body::from_stream(stream),
+    )
+        .into_response())
+}
+
 /// Write a file to workspace
 pub async fn write_file(
     State(state): State<AppState>,
@@ -196,6 +290,22 @@ pub async fn write_file(
     ))
 }
 
+/// Write raw bytes to a file in workspace
+pub async fn upload_file(
+    State(state): State<AppState>,
+    Path(workspace_id): Path<String>,
+    Query(query): Query<PathQuery>,
+    body: Bytes,
+) -> Result<Json<serde_json::Value>> {
+    state
+        .workspace_service
+        .write_file(&workspace_id, &query.path, &body)
+        .await?;
+    Ok(Json(
+        serde_json::json!({ "success": true, "path": query.path }),
+    ))
+}
+
 /// List directory contents in workspace
 pub async fn list_files(
     State(state): State<AppState>,
@@ -207,16 +317,7 @@ pub async fn list_files(
         .list_files(&workspace_id, &query.path)
         .await?;
 
-    let responses: Vec<FileInfoResponse> = files
-        .into_iter()
-        .map(|f| FileInfoResponse {
-            name: f.name,
-            path: f.path,
-            file_type: f.file_type,
-            size: f.size,
-            modified_at: f.modified_at.map(|t| t.to_rfc3339()),
-        })
-        .collect();
+    let responses: Vec<FileInfoResponse> = files.into_iter().map(Into::into).collect();
 
     Ok(Json(ListFilesResponse { files: responses }))
 }
@@ -297,11 +398,65 @@ pub async fn get_file_info(
         .get_file_info(&workspace_id, &query.path)
         .await?;
 
-    Ok(Json(FileInfoResponse {
-        name: info.name,
-        path: info.path,
-        file_type: info.file_type,
-        size: info.size,
-        modified_at: info.modified_at.map(|t| t.to_rfc3339()),
-    }))
+    Ok(Json(info.into()))
+}
+
+/// Get info for several files in one request
+pub async fn batch_get_file_info(
+    State(state): State<AppState>,
+    Path(workspace_id): Path<String>,
+    Json(req): Json<BatchPathsRequest>,
+) -> Json<BatchFileInfoResponse> {
+    let workspace_service = &state.workspace_service;
+    let workspace_id = workspace_id.as_str();
+    let lookups = req.paths.into_iter().map(|path| async move {
+        match workspace_service.get_file_info(workspace_id, &path).await {
+            Ok(info) => BatchFileInfoResult {
+                path,
+                status: 200,
+                info: Some(info.into()),
+                error: None,
+            },
+            Err(err) => BatchFileInfoResult {
+                path,
+                status: err.status_code().as_u16(),
+                info: None,
+                error: Some(ErrorResponse::from(&err)),
+            },
+        }
+    });
+
+    Json(BatchFileInfoResponse {
+        results: join_all(lookups).await,
+    })
+}
+
+/// Read several files in one request
+pub async fn batch_read_files(
+    State(state): State<AppState>,
+    Path(workspace_id): Path<String>,
+    Json(req): Json<BatchPathsRequest>,
+) -> Json<BatchReadFileResponse> {
+    let workspace_service = &state.workspace_service;
+    let workspace_id = workspace_id.as_str();
+    let reads = req.paths.into_iter().map(|path| async move {
+        match workspace_service.read_file_string(workspace_id, &path).await {
+            Ok(content) => BatchReadFileResult {
+                path,
+                status: 200,
+                content: Some(content),
+                error: None,
+            },
+            Err(err) => BatchReadFileResult {
+                path,
+                status: err.status_code().as_u16(),
+                content: None,
+                error: Some(ErrorResponse::from(&err)),
+            },
+        }
+    });
+
+    Json(BatchReadFileResponse {
+        results: join_all(reads).await,
+    })
 }
@@ -165,6 +165,20 @@ impl Error {
         }
     }
 
+    /// Get the ID of the resource the error refers to, if any
+    pub fn resource_id(&self) -> Option<&str> {
+        match self {
+            Error::SandboxNotFound(id)
+            | Error::TemplateNotFound(id)
+            | Error::WorkspaceNotFound(id)
+            | Error::FileNotFound(id)
+            | Error::PermissionDenied(id)
+            | Error::PtyNotFound(id)
+            | Error::AgentNotConnected(id) => Some(id.as_str()),
+            _ => None,
+        }
+    }
+
     /// Get the HTTP status code
     pub fn status_code(&self) -> StatusCode {
         match self {
@@ -210,16 +224,25 @@ pub struct ErrorResponse {
     pub message: String,
     #[serde(skip_serializing_if = "Option::is_none")]
     pub details: Option<String>,
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub resource_id: Option<String>,
+}
+
+impl From<&Error> for ErrorResponse {
+    fn from(err: &Error) -> Self {
+        ErrorResponse {
+            code: err.code(),
+            message: err.to_string(),
+            details: None,
+            resource_id: err.resource_id().map(str::to_string),
+        }
+    }
 }
 
 impl IntoResponse for Error {
     fn into_response(self) -> Response {
         let status = self.status_code();
-        let body = ErrorResponse {
-            code: self.code(),
-            message: self.to_string(),
-            details: None,
-        };
+        let body = ErrorResponse::from(&self);
 
         (status, Json(body)).into_response()
     }
@@ -179,6 +179,33 @@ impl WorkspaceService {
             .map_err(|e| Error::Internal(format!("Failed to read file: {}", e)))
     }
 
+    /// Open a file for streaming reads, returning the handle and its size
+    pub async fn open_file(&self, workspace_id: &str, path: &str) -> Result<(fs::File, u64)> {
+        // Verify workspace exists
+        self.repository.get(workspace_id).await?;
+
+        let full_path = self.resolve_path(workspace_id, path)?;
+
+        if !full_path.exists() {
+            return Err(Error::FileNotFound(path.to_string()));
+        }
+
+        if full_path.is_dir() {
+            return Err(Error::NotADirectory(path.to_string()));
+        }
+
+        let file = fs::File::open(&full_path)
+            .await
+            .map_err(|e| Error::Internal(format!("Failed to open file: {}", e)))?;
+        let size = file
+            .metadata()
+            .await
+            .map_err(|e| Error::Internal(format!("Failed to stat file: {}", e)))?
+            .len();
+
+        Ok((file, size))
+    }
+
     /// Read file content as string
     pub async fn read_file_string(&self, workspace_id: &str, path: &str) -> Result<String> {
         let bytes = self.read_file(workspace_id, path).await?;
@@ -3,11 +3,13 @@
 
 import os
 import sys
+import threading
 import time
 import json
-import urllib.request
-import urllib.error
-from typing import Optional, List, Dict, Any
+import http.client
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+from typing import Callable, Optional, List, Dict, Any
 from dataclasses import dataclass
 from contextlib import contextmanager
 
@@ -20,56 +22,89 @@ class TestResult:
     name: str
     passed: bool
     error: Optional[str] = None
-    duration: float = 0.0
+    duration_ms: int = 0
 
 results: List[TestResult] = []
 
+# Keeps result lines from concurrently running test cases from interleaving
+_output_lock = threading.Lock()
+
 @contextmanager
 def test_case(name: str):
     """Context manager for running a test case"""
-    start = time.time()
+    start = time.perf_counter_ns()
     try:
         yield
-        duration = time.time() - start
-        results.append(TestResult(name=name, passed=True, duration=duration))
-        print(f"  ✓ {name} ({duration*1000:.0f}ms)")
+        duration_ms = (time.perf_counter_ns() - start) // 1_000_000
+        with _output_lock:
+            results.append(TestResult(name=name, passed=True, duration_ms=duration_ms))
+            print(f"  ✓ {name} ({duration_ms}ms)")
     except AssertionError as e:
-        duration = time.time() - start
-        results.append(TestResult(name=name, passed=False, error=str(e), duration=duration))
-        print(f"  ✗ {name} ({duration*1000:.0f}ms)")
-        print(f"    Error: {e}")
+        duration_ms = (time.perf_counter_ns() - start) // 1_000_000
+        with _output_lock:
+            results.append(TestResult(name=name, passed=False, error=str(e), duration_ms=duration_ms))
+            print(f"  ✗ {name} ({duration_ms}ms)")
+            print(f"    Error: {e}")
     except Exception as e:
-        duration = time.time() - start
-        results.append(TestResult(name=name, passed=False, error=str(e), duration=duration))
-        print(f"  ✗ {name} ({duration*1000:.0f}ms)")
-        print(f"    Error: {e}")
+        duration_ms = (time.perf_counter_ns() - start) // 1_000_000
+        with _output_lock:
+            results.append(TestResult(name=name, passed=False, error=str(e), duration_ms=duration_ms))
+            print(f"  ✗ {name} ({duration_ms}ms)")
+            print(f"    Error: {e}")
 
 
 class WorkspaceClient:
-    """Simple HTTP client for Workspace API using standard library"""
+    """Simple HTTP client for Workspace API using standard library
+
+    Requests share one keep-alive connection, so a test run pays a single
+    TCP (and TLS) handshake instead of one per call.
+    """
 
     def __init__(self, base_url: str, timeout: float = 60.0):
         self.base_url = base_url
         self.api_url = f"{base_url}/api/v1"
         self.timeout = timeout
 
-    def _request(self, method: str, path: str, data: Optional[Dict] = None) -> Dict[str, Any]:
-        url = f"{self.api_url}{path}"
+        parts = urlsplit(self.api_url)
+        connection_class = (
+            http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+        )
+        self._prefix = parts.path
+        self._conn = connection_class(parts.hostname, parts.port, timeout=timeout)
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> "WorkspaceClient":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def _send(self, method: str, path: str, body: Optional[bytes]) -> http.client.HTTPResponse:
         headers = {"Content-Type": "application/json"}
+        try:
+            self._conn.request(method, f"{self._prefix}{path}", body=body, headers=headers)
+            return self._conn.getresponse()
+        except (ConnectionError, http.client.BadStatusLine):
+            # The server closed the idle keep-alive connection; reconnect once
+            self._conn.close()
+            self._conn.request(method, f"{self._prefix}{path}", body=body, headers=headers)
+            return self._conn.getresponse()
 
+    def _request(self, method: str, path: str, data: Optional[Dict] = None) -> Dict[str, Any]:
         if data:
             body = json.dumps(data).encode("utf-8")
         else:
             body = None
 
-        req = urllib.request.Request(url, data=body, headers=headers, method=method)
-
-        try:
-            with urllib.request.urlopen(req, timeout=self.timeout) as response:
-                return json.loads(response.read().decode("utf-8"))
-        except urllib.error.HTTPError as e:
+        response = self._send(method, path, body)
+        # Read the whole body so the connection can be reused
+        payload = response.read().decode("utf-8")
+        if response.status >= 400:
             # Re-raise with status code info
-            raise HttpError(e.code, e.read().decode("utf-8")) from e
+            raise HttpError(response.status, payload)
+        return json.loads(payload) if payload else {}
 
     def health(self) -> Dict[str, Any]:
         return self._request("GET", "/health")
@@ -108,6 +143,16 @@ class WorkspaceClient:
             path += "?force=true"
         return self._request("DELETE", path)
 
+    def delete_many(self, sandbox_ids: List[str], force: bool = False) -> None:
+        """Delete sandboxes concurrently, one keep-alive connection per worker"""
+        def delete(sandbox_id: str) -> None:
+            with WorkspaceClient(self.base_url, self.timeout) as client:
+                client.delete_sandbox(sandbox_id, force=force)
+
+        with ThreadPoolExecutor(max_workers=min(len(sandbox_ids), 8) or 1) as pool:
+            for future in [pool.submit(delete, sandbox_id) for sandbox_id in sandbox_ids]:
+                future.result()
+
 
 class HttpError(Exception):
     """HTTP error with status code"""
@@ -117,6 +162,17 @@ class HttpError(Exception):
         super().__init__(f"HTTP {status_code}: {message}")
 
 
+def run_concurrently(*cases: Callable[["WorkspaceClient"], None]) -> None:
+    """Run independent test cases at once, each with its own client connection"""
+    def run(case: Callable[[WorkspaceClient], None]) -> None:
+        with WorkspaceClient(BASE_URL) as client:
+            case(client)
+
+    with ThreadPoolExecutor(max_workers=len(cases)) as pool:
+        for future in [pool.submit(run, case) for case in cases]:
+            future.result()
+
+
 def main():
     print("Workspace SDK E2E Tests (Python)")
     print("================================")
@@ -125,6 +181,8 @@ def main():
 
     client = WorkspaceClient(BASE_URL)
     test_sandbox_id: Optional[str] = None
+    # Sandboxes created by test cases that failed before cleaning up
+    leftover_ids: List[str] = []
 
     try:
         # Health tests
@@ -155,30 +213,39 @@ def main():
         with test_case("list sandboxes includes created sandbox"):
             result = client.list_sandboxes()
             sandboxes = result.get("sandboxes", [])
-            found = any(s.get("id") == test_sandbox_id for s in sandboxes)
-            assert found, "Created sandbox not found in list"
-
-        with test_case("create sandbox with environment variables"):
-            sandbox = client.create_sandbox(
-                template=BASE_IMAGE,
-                name="e2e-python-env-test",
-                env={"MY_VAR": "test_value", "ANOTHER_VAR": "another_value"},
-            )
-            env = sandbox.get("env", {})
-            assert env.get("MY_VAR") == "test_value", f"ENV mismatch: {env}"
-            # Cleanup
-            client.delete_sandbox(sandbox["id"], force=True)
-
-        with test_case("create sandbox with metadata"):
-            sandbox = client.create_sandbox(
-                template=BASE_IMAGE,
-                name="e2e-python-metadata-test",
-                metadata={"project": "test-project", "owner": "test-user"},
-            )
-            metadata = sandbox.get("metadata", {})
-            assert metadata.get("project") == "test-project", f"Metadata mismatch: {metadata}"
-            # Cleanup
-            client.delete_sandbox(sandbox["id"], force=True)
+            ids = {s.get("id") for s in sandboxes}
+            assert test_sandbox_id in ids, "Created sandbox not found in list"
+
+        # Independent of the sandbox above and of each other
+        def env_case(client: WorkspaceClient) -> None:
+            with test_case("create sandbox with environment variables"):
+                sandbox = client.create_sandbox(
+                    template=BASE_IMAGE,
+                    name="e2e-python-env-test",
+                    env={"MY_VAR": "test_value", "ANOTHER_VAR": "another_value"},
+                )
+                leftover_ids.append(sandbox["id"])
+                env = sandbox.get("env", {})
+                assert env.get("MY_VAR") == "test_value", f"ENV mismatch: {env}"
+                # Cleanup
+                client.delete_sandbox(sandbox["id"], force=True)
+                leftover_ids.remove(sandbox["id"])
+
+        def metadata_case(client: WorkspaceClient) -> None:
+            with test_case("create sandbox with metadata"):
+                sandbox = client.create_sandbox(
+                    template=BASE_IMAGE,
+                    name="e2e-python-metadata-test",
+                    metadata={"project": "test-project", "owner": "test-user"},
+                )
+                leftover_ids.append(sandbox["id"])
+                metadata = sandbox.get("metadata", {})
+                assert metadata.get("project") == "test-project", f"Metadata mismatch: {metadata}"
+                # Cleanup
+                client.delete_sandbox(sandbox["id"], force=True)
+                leftover_ids.remove(sandbox["id"])
+
+        run_concurrently(env_case, metadata_case)
 
         with test_case("delete sandbox"):
             assert test_sandbox_id, "No sandbox ID available"
@@ -203,21 +270,24 @@ def main():
                 assert e.status_code == 404, f"Expected 404, got {e.status_code}"
 
     finally:
-        # Cleanup any remaining test sandbox
+        # Cleanup any remaining test sandboxes
         if test_sandbox_id:
+            leftover_ids.append(test_sandbox_id)
+        if leftover_ids:
             try:
-                client.delete_sandbox(test_sandbox_id, force=True)
+                client.delete_many(leftover_ids, force=True)
             except Exception:
                 pass
+        client.close()
 
     # Print summary
     print("\n================================")
     passed = sum(1 for r in results if r.passed)
     failed = sum(1 for r in results if not r.passed)
-    total_duration = sum(r.duration for r in results)
+    total_duration_ms = sum(r.duration_ms for r in results)
 
     print(f"Results: {passed} passed, {failed} failed")
-    print(f"Total time: {total_duration*1000:.0f}ms")
+    print(f"Total time: {total_duration_ms}ms")
 
     if failed > 0:
         print("\nFailed tests:")
@@ -0,0 +1,49 @@
+"""
+pytest fixtures for the Python SDK end-to-end tests
+
+``main()`` in test_python_sdk.py passes the clients in itself; these
+fixtures provide the same ``client`` argument when the file runs under pytest.
+"""
+
+import inspect
+import os
+import sys
+
+import pytest
+
+# Add SDK to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../sdk-python/src'))
+
+from workspace_sdk import WorkspaceClient, AsyncWorkspaceClient
+
+try:
+    import pytest_asyncio
+except ImportError:
+    pytest_asyncio = None
+
+API_URL = os.environ.get("WORKSPACE_API_URL", "http://localhost:8080")
+
+
+@pytest.fixture(scope="session")
+def sync_client():
+    """One sync client shared by every sync test, as in main()"""
+    with WorkspaceClient.create(API_URL, timeout=60.0) as client:
+        yield client
+
+
+if pytest_asyncio is not None:
+    @pytest_asyncio.fixture
+    async def async_client():
+        """Async client opened on the running test's event loop"""
+        async with AsyncWorkspaceClient.create(API_URL) as client:
+            yield client
+
+
+@pytest.fixture
+def client(request):
+    """The sync client for sync tests, the async client for async tests"""
+    if inspect.iscoroutinefunction(request.function):
+        if pytest_asyncio is None:
+            pytest.skip("async tests need pytest-asyncio")
+        return request.getfixturevalue("async_client")
+    return request.getfixturevalue("sync_client")